@@ -8,8 +8,10 @@ from . import storage
 class Dataset(BaseLabResource):
     def get_dir(self):
         """Abstract method on BaseLabResource"""
-        dataset_id_safe = secure_filename(str(self.id))
-        return storage.join(get_datasets_dir(), dataset_id_safe)
+        if self._dir is None:
+            dataset_id_safe = secure_filename(str(self.id))
+            self._dir = storage.join(get_datasets_dir(), dataset_id_safe)
+        return self._dir
 
     def _default_json(self):
         # Default metadata modeled after API dataset table fields
@@ -2,23 +2,43 @@
 
 import os
 import contextvars
+import functools
 from werkzeug.utils import secure_filename
 from . import storage
 from .storage import _current_tfl_storage_uri
 
-# TFL_HOME_DIR
-if "TFL_HOME_DIR" in os.environ and not (_current_tfl_storage_uri.get() or os.getenv("TFL_STORAGE_URI")):
-    HOME_DIR = os.environ["TFL_HOME_DIR"]
-    if not os.path.exists(HOME_DIR):
-        print(f"Error: Home directory {HOME_DIR} does not exist")
-        exit(1)
-    print(f"Home directory is set to: {HOME_DIR}")
-else:
-    # If TFL_STORAGE_URI is set (via context or env), HOME_DIR concept maps to storage.root_uri()
-    HOME_DIR = storage.root_uri() if (_current_tfl_storage_uri.get() or os.getenv("TFL_STORAGE_URI")) else os.path.join(os.path.expanduser("~"), ".transformerlab")
-    if not (_current_tfl_storage_uri.get() or os.getenv("TFL_STORAGE_URI")):
-        os.makedirs(name=HOME_DIR, exist_ok=True)
-        print(f"Using default home directory: {HOME_DIR}")
+
+def _storage_uri_set() -> bool:
+    return bool(_current_tfl_storage_uri.get() or os.getenv("TFL_STORAGE_URI"))
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_local_home_dir(env_home: str | None, user_home: str) -> str:
+    # Existence checks and makedirs run once per (TFL_HOME_DIR, ~) pair
+    if env_home is not None:
+        if not os.path.exists(env_home):
+            print(f"Error: Home directory {env_home} does not exist")
+            exit(1)
+        print(f"Home directory is set to: {env_home}")
+        return env_home
+    home_dir = os.path.join(user_home, ".transformerlab")
+    os.makedirs(name=home_dir, exist_ok=True)
+    print(f"Using default home directory: {home_dir}")
+    return home_dir
+
+
+def get_home_dir() -> str:
+    """
+    Resolve TFL_HOME_DIR from the current environment on every call.
+    When TFL_STORAGE_URI is set (via context or env), the home dir maps to storage.root_uri().
+    """
+    if _storage_uri_set():
+        return storage.root_uri()
+    return _resolve_local_home_dir(os.environ.get("TFL_HOME_DIR"), os.path.expanduser("~"))
+
+
+# Legacy constant for backward compatibility; resolved once at import time
+HOME_DIR = get_home_dir()
 
 # Context var for organization id (set by host app/session)
 _current_org_id: contextvars.ContextVar[str | None] = contextvars.ContextVar(
@@ -33,6 +53,21 @@ def set_organization_id(organization_id: str | None) -> None:
         _current_tfl_storage_uri.set(None)
 
 
+# Remote workspace paths already created in this process. Creating a remote
+# directory is a network round trip, so it is done once per path; local paths
+# are re-created on every call (a single mkdir) in case they were deleted.
+_known_remote_workspace_dirs: set[str] = set()
+
+
+def _ensure_workspace_dir(path: str) -> str:
+    if storage.is_local(path):
+        storage.makedirs(path, exist_ok=True)
+    elif path not in _known_remote_workspace_dirs:
+        storage.makedirs(path, exist_ok=True)
+        _known_remote_workspace_dirs.add(path)
+    return path
+
+
 def get_workspace_dir() -> str:
     # Remote SkyPilot workspace override (highest precedence)
     # Only return container workspace path when value is exactly "true"
@@ -56,16 +91,12 @@ def get_workspace_dir() -> str:
         # If the storage URI is set, use it for the org workspace
         if _current_tfl_storage_uri.get() is not None:
             return _current_tfl_storage_uri.get()
-        path = storage.join(HOME_DIR, "orgs", org_id, "workspace")
-        storage.makedirs(path, exist_ok=True)
-        return path
+        return _ensure_workspace_dir(storage.join(get_home_dir(), "orgs", org_id, "workspace"))
     
     if os.getenv("TFL_STORAGE_URI"):
         return storage.root_uri()
 
-    path = storage.join(HOME_DIR, "workspace")
-    storage.makedirs(path, exist_ok=True)
-    return path
+    return _ensure_workspace_dir(storage.join(get_home_dir(), "workspace"))
 
 
 # Legacy constant for backward compatibility
@@ -112,7 +143,7 @@ def get_global_log_path() -> str:
 
 
 def get_logs_dir() -> str:
-    path = storage.join(HOME_DIR, "logs")
+    path = storage.join(get_home_dir(), "logs")
     storage.makedirs(path, exist_ok=True)
     return path
 
@@ -149,9 +180,8 @@ def get_tasks_dir() -> str:
     if tfl_storage_uri is not None:
         return storage.join(tfl_storage_uri, "tasks")
 
-    path = storage.join(get_workspace_dir(), "tasks")
-    storage.makedirs(path, exist_ok=True)
-    return path
+    # Task lookups call this for every Task; remote stores create it once per path
+    return _ensure_workspace_dir(storage.join(get_workspace_dir(), "tasks"))
 
 
 def dataset_dir_by_id(dataset_id: str) -> str:
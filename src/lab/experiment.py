@@ -1,5 +1,6 @@
 import threading
 import time
+from contextlib import contextmanager
 from werkzeug.utils import secure_filename
 
 from .dirs import get_experiments_dir, get_jobs_dir, get_workspace_dir
@@ -22,6 +23,9 @@ class Experiment(BaseLabResource):
     _cache_rebuild_lock = threading.Lock()
     _cache_rebuild_thread = None
 
+    # Per-thread batch_update() state: experiment_id -> {"depth", "rebuild", "added"}
+    _batch_local = threading.local()
+
     def __init__(self, experiment_id, create_new=False):
         self.id = experiment_id
         # Auto-initialize if create_new=True and experiment doesn't exist
@@ -30,8 +34,10 @@ class Experiment(BaseLabResource):
 
     def get_dir(self):
         """Abstract method on BaseLabResource"""
-        experiment_id_safe = secure_filename(str(self.id))
-        return storage.join(get_experiments_dir(), experiment_id_safe)
+        if self._dir is None:
+            experiment_id_safe = secure_filename(str(self.id))
+            self._dir = storage.join(get_experiments_dir(), experiment_id_safe)
+        return self._dir
 
     def _default_json(self):
         return {"name": self.id, "id": self.id, "config": {}}
@@ -45,8 +51,8 @@ class Experiment(BaseLabResource):
             "index": self.DEFAULT_JOBS_INDEX,
             "cached_jobs": {}
         }
-        with storage.open(jobs_json_path, "w") as f:
-            json.dump(empty_jobs_data, f, indent=4)
+        with storage.open(jobs_json_path, "wb") as f:
+            f.write(json.dumps(empty_jobs_data, indent=4).encode("utf-8"))
 
     def update_config_field(self, key, value):
         """Update a single key in config."""
@@ -99,8 +105,8 @@ class Experiment(BaseLabResource):
                     if storage.isdir(exp_path):
                         index_file = storage.join(exp_path, "index.json")
                         if storage.exists(index_file):
-                            with storage.open(index_file, "r") as f:
-                                data = json.load(f)
+                            with storage.open(index_file, "rb") as f:
+                                data = json.loads(f.read())
                             experiments.append(data)
                 except Exception:
                     pass
@@ -143,15 +149,21 @@ class Experiment(BaseLabResource):
         status: If not blank, filter by jobs with this status.
         """
 
+        # Read jobs.json once for both the job list and the cached job data
+        try:
+            jobs_data = self._read_jobs_data()
+        except Exception:
+            jobs_data = {}
+
         # First get jobs of the passed type
-        job_list = []
+        jobs = self._jobs_index(jobs_data)
         if type:
-            job_list = self._get_jobs_of_type(type)
+            job_list = jobs.get(type, [])
         else:
-            job_list = self._get_all_jobs()
+            job_list = [job_id for value in jobs.values() if isinstance(value, list) for job_id in value]
 
         # Get cached job data from jobs.json
-        cached_jobs = self._get_cached_jobs_data()
+        cached_jobs = jobs_data.get("cached_jobs", {})
         # print(f"Cached jobs: {cached_jobs}")
         # print(f"Job list: {job_list}")
         
@@ -257,7 +269,7 @@ class Experiment(BaseLabResource):
                 # Prefer the latest snapshot if available; fall back to index.json
                 index_file = storage.join(entry_path, "index.json")
                 try:
-                    with storage.open(index_file, "r", encoding="utf-8", fs=fs_override) as lf:
+                    with storage.open(index_file, "rb", fs=fs_override) as lf:
                         content = lf.read().strip()
                         if not content:
                             # Skip empty files
@@ -290,8 +302,8 @@ class Experiment(BaseLabResource):
             }
             if results:
                 try:
-                    with storage.open(self._jobs_json_file(workspace_dir=workspace_dir, experiment_id=self.id), "w", fs=fs_override) as out:
-                        json.dump(jobs_data, out, indent=4)
+                    with storage.open(self._jobs_json_file(workspace_dir=workspace_dir, experiment_id=self.id), "wb", fs=fs_override) as out:
+                        out.write(json.dumps(jobs_data, indent=4).encode("utf-8"))
                 except Exception as e:
                     print(f"Error writing jobs index: {e}")
                     pass
@@ -299,116 +311,85 @@ class Experiment(BaseLabResource):
             print(f"Error rebuilding jobs index: {e}")
             pass
 
-    def _get_cached_jobs_data(self):
+    def _read_jobs_data(self):
         """
-        Get cached job data from jobs.json file.
-        If the file doesn't exist, create it with default structure.
+        Return the parsed jobs.json for this experiment.
+        If the file doesn't exist, rebuild the index to create it first.
         """
         jobs_json_path = self._jobs_json_file()
         try:
-            with storage.open(jobs_json_path, "r") as f:
-                jobs_data = json.load(f)
-                # Handle both old format (just index) and new format (with cached_jobs)
-                if "cached_jobs" in jobs_data:
-                    return jobs_data["cached_jobs"]
-                else:
-                    # Old format - return empty dict
-                    return {}
+            with storage.open(jobs_json_path, "rb") as f:
+                return json.loads(f.read())
         except FileNotFoundError:
             # Rebuild jobs index to discover and create jobs.json
             self.rebuild_jobs_index()
-            # Try to read the newly created file
-            try:
-                with storage.open(jobs_json_path, "r") as f:
-                    jobs_data = json.load(f)
-                    if "cached_jobs" in jobs_data:
-                        return jobs_data["cached_jobs"]
-                    else:
-                        return {}
-            except Exception:
-                return {}
+            with storage.open(jobs_json_path, "rb") as f:
+                return json.loads(f.read())
+
+    @staticmethod
+    def _jobs_index(jobs_data):
+        # Handle both old format (just index) and new format (with index key)
+        if "index" in jobs_data:
+            return jobs_data["index"]
+        return jobs_data  # Old format
+
+    def _get_cached_jobs_data(self):
+        """
+        Get cached job data from jobs.json file.
+        If the file doesn't exist, create it with default structure.
+        """
+        try:
+            jobs_data = self._read_jobs_data()
         except Exception:
             return {}
+        # Old format (just index) has no cached data
+        return jobs_data.get("cached_jobs", {})
 
     def _get_all_jobs(self):
         """
         Amalgamates all jobs in the index file.
         If the file doesn't exist, create it with default structure.
         """
-        jobs_json_path = self._jobs_json_file()
         try:
-            with storage.open(jobs_json_path, "r") as f:
-                jobs_data = json.load(f)
-                # Handle both old format (just index) and new format (with index key)
-                if "index" in jobs_data:
-                    jobs = jobs_data["index"]
-                else:
-                    jobs = jobs_data  # Old format
-                results = []
-                for key, value in jobs.items():
-                    if isinstance(value, list):
-                        results.extend(value)
-                return results
-        except FileNotFoundError:
-            # Rebuild jobs index to discover and create jobs.json
-            self.rebuild_jobs_index()
-            # Try to read the newly created file
-            try:
-                with storage.open(jobs_json_path, "r") as f:
-                    jobs_data = json.load(f)
-                    if "index" in jobs_data:
-                        jobs = jobs_data["index"]
-                    else:
-                        jobs = jobs_data
-                    results = []
-                    for key, value in jobs.items():
-                        if isinstance(value, list):
-                            results.extend(value)
-                    return results
-            except Exception:
-                return []
+            jobs = self._jobs_index(self._read_jobs_data())
         except Exception:
             return []
+        results = []
+        for key, value in jobs.items():
+            if isinstance(value, list):
+                results.extend(value)
+        return results
 
     def _get_jobs_of_type(self, type="TRAIN"):
         """ "
         Returns all jobs of a specific type in this experiment's index file.
         If the file doesn't exist, create it with default structure.
         """
-        jobs_json_path = self._jobs_json_file()
         try:
-            with storage.open(jobs_json_path, "r") as f:
-                jobs_data = json.load(f)
-                # Handle both old format (just index) and new format (with index key)
-                if "index" in jobs_data:
-                    jobs = jobs_data["index"]
-                else:
-                    jobs = jobs_data  # Old format
-                result = jobs.get(type, [])
-                return result
+            return self._jobs_index(self._read_jobs_data()).get(type, [])
         except FileNotFoundError:
-            # Rebuild jobs index to discover and create jobs.json
-            self.rebuild_jobs_index()
-            # Try to read the newly created file
-            try:
-                with storage.open(jobs_json_path, "r") as f:
-                    jobs_data = json.load(f)
-                    if "index" in jobs_data:
-                        jobs = jobs_data["index"]
-                    else:
-                        jobs = jobs_data
-                    result = jobs.get(type, [])
-                    return result
-            except Exception:
-                return []
+            return []
         except Exception as e:
             print("Failed getting jobs:", e)
             return []
 
     def _add_job(self, job_id, type):
+        batch = self._batch_states().get(self.id)
+        if batch is not None:
+            # Written to jobs.json once when the outermost batch_update() exits
+            batch["added"].append((job_id, type))
+            self._trigger_cache_rebuild(get_workspace_dir())
+            return
+        self._write_added_jobs([(job_id, type)])
+
+        # Trigger background cache rebuild
+        self._trigger_cache_rebuild(get_workspace_dir())
+
+    def _write_added_jobs(self, added):
+        """Append (job_id, type) pairs to jobs.json with one read and one write."""
         try:
-            with storage.open(self._jobs_json_file(), "r") as f:
-                jobs_data = json.load(f)
+            with storage.open(self._jobs_json_file(), "rb") as f:
+                jobs_data = json.loads(f.read())
         except Exception:
             jobs_data = {"index": {}, "cached_jobs": {}}
         
@@ -419,17 +400,15 @@ class Experiment(BaseLabResource):
             jobs = jobs_data
             jobs_data = {"index": jobs, "cached_jobs": {}}
         
-        if type in jobs:
-            jobs[type].append(job_id)
-        else:
-            jobs[type] = [job_id]
+        for job_id, type in added:
+            if type in jobs:
+                jobs[type].append(job_id)
+            else:
+                jobs[type] = [job_id]
         
         # Update the file with new structure
-        with storage.open(self._jobs_json_file(), "w") as f:
-            json.dump(jobs_data, f, indent=4)
-        
-        # Trigger background cache rebuild
-        self._trigger_cache_rebuild(get_workspace_dir())
+        with storage.open(self._jobs_json_file(), "wb") as f:
+            f.write(json.dumps(jobs_data, indent=4).encode("utf-8"))
     
     @classmethod
     def _start_background_cache_rebuild(cls):
@@ -470,6 +449,11 @@ class Experiment(BaseLabResource):
     
     def _trigger_cache_rebuild(self, workspace_dir, sync=False):
         """Trigger a cache rebuild for this experiment."""
+        batch = self._batch_states().get(self.id)
+        if batch is not None:
+            # Deferred to the end of batch_update()
+            batch["rebuild"].add(workspace_dir)
+            return
         if sync:
             # Run synchronously (useful for tests)
             self.rebuild_jobs_index(workspace_dir=workspace_dir)
@@ -481,6 +465,37 @@ class Experiment(BaseLabResource):
             with self._cache_rebuild_lock:
                 self._cache_rebuild_pending.add((self.id, workspace_dir))
     
+    @classmethod
+    def _batch_states(cls):
+        states = getattr(cls._batch_local, "states", None)
+        if states is None:
+            states = cls._batch_local.states = {}
+        return states
+
+    @contextmanager
+    def batch_update(self):
+        """
+        Context manager that batches jobs.json updates for this experiment.
+        Jobs added and index rebuilds triggered inside the block by the current
+        thread (e.g. by Job.set_experiment) are deferred: on exit the added
+        jobs are written to jobs.json in one write and the index is rebuilt
+        once, so jobs.json may be stale until the block ends. Nested blocks are
+        flushed by the outermost.
+        """
+        states = self._batch_states()
+        batch = states.setdefault(self.id, {"depth": 0, "rebuild": set(), "added": []})
+        batch["depth"] += 1
+        try:
+            yield self
+        finally:
+            batch["depth"] -= 1
+            if batch["depth"] == 0:
+                del states[self.id]
+                if batch["added"]:
+                    self._write_added_jobs(batch["added"])
+                for workspace_dir in batch["rebuild"]:
+                    self.rebuild_jobs_index(workspace_dir=workspace_dir)
+
     # TODO: For experiments, delete the same way as jobs
     def delete(self):
         """Delete the experiment and all associated jobs."""
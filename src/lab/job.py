@@ -1,4 +1,7 @@
+import atexit
 import posixpath
+import threading
+import time
 from werkzeug.utils import secure_filename
 
 from . import dirs
@@ -7,27 +10,129 @@ from .dirs import get_workspace_dir
 from . import storage
 
 
+class _LogBuffer:
+    """
+    Log lines waiting to be appended to one log file. Shared by every Job
+    handle writing to that file, so their lines keep their order.
+    """
+
+    def __init__(self):
+        self.lines: list[str] = []
+        self.nbytes = 0
+        self.last_flush = 0.0
+        self.timer: threading.Timer | None = None
+        # Guards the fields above
+        self.lock = threading.Lock()
+        # Held while writing, so flushes of the same file don't interleave
+        self.write_lock = threading.Lock()
+
+
+# Log path -> its buffer. Entries stay for the life of the process, so the
+# exit-time flush below sees lines logged through handles already dropped.
+_log_buffers: dict[str, _LogBuffer] = {}
+_log_buffers_lock = threading.Lock()
+
+
+def _log_buffer_for(log_path: str) -> _LogBuffer:
+    buf = _log_buffers.get(log_path)
+    if buf is None:
+        with _log_buffers_lock:
+            buf = _log_buffers.setdefault(log_path, _LogBuffer())
+    return buf
+
+
+@atexit.register
+def _flush_pending_job_logs():
+    for log_path, buf in list(_log_buffers.items()):
+        _flush_log_buffer(log_path, buf)
+
+
+def _flush_log_buffer(log_path: str, buf: _LogBuffer) -> None:
+    """Append buf's pending lines to log_path."""
+    with buf.write_lock:
+        with buf.lock:
+            if buf.timer is not None:
+                buf.timer.cancel()
+                buf.timer = None
+            buf.last_flush = time.monotonic()
+            if not buf.lines:
+                return
+            pending = "".join(buf.lines)
+            buf.lines = []
+            buf.nbytes = 0
+        _append_log(log_path, pending)
+
+
+def _append_log(log_path: str, pending: str) -> None:
+    try:
+        storage.makedirs(posixpath.dirname(log_path), exist_ok=True)
+
+        # Local files can be appended to directly
+        if storage.is_local(log_path):
+            with open(log_path, "a+b") as f:
+                # Start on a new line if the file ends mid-line (e.g. output
+                # from a subprocess)
+                if f.seek(0, 2) > 0:
+                    f.seek(-1, 2)
+                    if f.read(1) != b"\n":
+                        pending = "\n" + pending
+                f.write(pending.encode("utf-8"))
+            return
+
+        # Read existing content if file exists
+        existing_content = ""
+        if storage.exists(log_path):
+            with storage.open(log_path, "r", encoding="utf-8") as f:
+                existing_content = f.read()
+
+        # Append new messages to existing content on a new line
+        if existing_content and not existing_content.endswith("\n"):
+            existing_content += "\n"
+        new_content = existing_content + pending
+
+        # Write back the complete content
+        with storage.open(log_path, "w", encoding="utf-8") as f:
+            f.write(new_content)
+            f.flush()
+    except Exception:
+        # Best-effort file logging; ignore file errors to avoid crashing job
+        pass
+
+
 class Job(BaseLabResource):
     """
     Used to update status and info of long-running jobs.
     """
 
+    # Buffered log lines are written once either threshold is crossed
+    LOG_FLUSH_BYTES = 64 * 1024
+    LOG_FLUSH_INTERVAL = 1.0
+
     def __init__(self, job_id):
         self.id = job_id
         self.should_stop = False
+        # Computed once; used by every path built for this job
+        self._id_str = str(job_id)
+        self._safe_id = secure_filename(self._id_str)
+        # Resolved on the first log_info()
+        self._log_path: str | None = None
+        # Output directories, resolved (and created) on first use
+        self._checkpoints_dir: str | None = None
+        self._artifacts_dir: str | None = None
+        self._eval_results_dir: str | None = None
 
     def get_dir(self):
         """Abstract method on BaseLabResource"""
-        job_id_safe = secure_filename(str(self.id))
-        job_dir = storage.join(dirs.get_jobs_dir(), job_id_safe)
-        return job_dir
+        if self._dir is None:
+            self._dir = storage.join(dirs.get_jobs_dir(), self._safe_id)
+        return self._dir
 
     def get_log_path(self):
         """
         Returns the path where this job should write logs.
         """
         # Default location for log file
-        log_path = storage.join(self.get_dir(), f"output_{self.id}.txt")
+        log_path = storage.join(self.get_dir(), f"output_{self._id_str}.txt")
 
         if not storage.exists(log_path):
             # Then check if there is a path explicitly set in the job data
@@ -62,8 +167,11 @@ class Job(BaseLabResource):
         }
 
     def set_experiment(self, experiment_id: str, sync_rebuild: bool = False):
-        self._update_json_data_field("experiment_id", experiment_id)
-        self.update_job_data_field("experiment_name", experiment_id)
+        # Set experiment_id and job_data.experiment_name in one write
+        json_data = self.get_json_data()
+        json_data["experiment_id"] = experiment_id
+        json_data.setdefault("job_data", {})["experiment_name"] = experiment_id
+        self._set_json_data(json_data)
         
         # Trigger cache rebuild for the experiment to discover this job
         try:
@@ -90,8 +198,14 @@ class Job(BaseLabResource):
         status: str representing the status of the job
         """
         self._update_json_data_field("status", status)
-        
+
         # Trigger rebuild on every status update
+        self._trigger_experiment_cache_rebuild()
+
+    def _trigger_experiment_cache_rebuild(self):
+        """
+        Ask the experiment this job belongs to to rebuild its jobs cache.
+        """
         try:
             from .experiment import Experiment
             experiment_id = self.get_experiment_id()
@@ -133,6 +247,13 @@ class Job(BaseLabResource):
         """
         Updates a key-value pair in the job_data JSON object.
         """
+        self.update_job_data_fields({key: value})
+
+    def update_job_data_fields(self, updates: dict):
+        """
+        Updates several key-value pairs in the job_data JSON object
+        with a single read and write.
+        """
         # Fetch current job_data
         json_data = self.get_json_data()
 
@@ -140,15 +261,104 @@ class Job(BaseLabResource):
         if "job_data" not in json_data:
             json_data["job_data"] = {}
 
-        # Set the key property to value and save the whole object
-        json_data["job_data"][key] = value
+        # Set the properties and save the whole object
+        json_data["job_data"].update(updates)
         self._set_json_data(json_data)
 
+    def update_many(self, job_data: dict | None = None, **fields):
+        """
+        Sets top-level fields (e.g. status, progress) and merges job_data
+        updates with a single read and write of index.json.
+        """
+        with self.buffered():
+            if fields:
+                self.update_fields(**fields)
+            if job_data:
+                self.update_job_data_fields(job_data)
+
+        # Same as update_status: a status change needs the experiment cache rebuilt
+        if "status" in fields:
+            self._trigger_experiment_cache_rebuild()
+
+    def append_job_data_list(self, key: str, value, updates: dict | None = None):
+        """
+        Appends value to the list stored under key in the job_data JSON object,
+        creating the list if needed. Extra job_data fields in updates are set
+        in the same write.
+        """
+        self.extend_job_data_list(key, [value], updates=updates)
+
+    def extend_job_data_list(self, key: str, values: list, updates: dict | None = None):
+        """
+        Like append_job_data_list, but appends several values with a single read and write.
+        """
+        json_data = self.get_json_data()
+
+        # If there isn't a job_data property then make one
+        if "job_data" not in json_data:
+            json_data["job_data"] = {}
+
+        job_data = json_data["job_data"]
+        existing = job_data.get(key)
+        if isinstance(existing, list):
+            existing.extend(values)
+        else:
+            job_data[key] = list(values)
+        if updates:
+            job_data.update(updates)
+        self._set_json_data(json_data)
+
+    def set_job_completion_status(
+        self,
+        completion_status: str,
+        completion_details: str,
+        score=None,
+        additional_output_path: str | None = None,
+        plot_data_path: str | None = None,
+        progress: int | None = None,
+        status: str | None = None,
+    ):
+        """
+        Record the completion of this job in a single read/write of index.json.
+
+        completion_status: "success" or "failed"
+        completion_details: human readable completion message
+        progress/status: optionally also set the top-level progress and status
+        """
+        json_data = self.get_json_data()
+        job_data = json_data.setdefault("job_data", {})
+
+        job_data["completion_status"] = completion_status
+        job_data["completion_details"] = completion_details
+        if completion_status == "failed":
+            job_data["status"] = "FAILED"
+        # Optional fields are only recorded when given (and, for strings, not blank)
+        for key, value in (
+            ("score", score),
+            ("additional_output_path", additional_output_path),
+            ("plot_data_path", plot_data_path),
+        ):
+            if value is not None and (not isinstance(value, str) or value.strip() != ""):
+                job_data[key] = value
+
+        if progress is not None:
+            json_data["progress"] = progress
+        if status is not None:
+            json_data["status"] = status
+        self._set_json_data(json_data)
+
+        if status is not None:
+            self._trigger_experiment_cache_rebuild()
+
     def log_info(self, message):
         """
         Save info message to output log file and display to terminal.
 
-        TODO: Using logging or something proper to do this.
+        A message is written straight away if the log file was last written
+        LOG_FLUSH_INTERVAL seconds ago or more. Otherwise it is buffered and
+        written by a timer at the end of the interval, or sooner once
+        LOG_FLUSH_BYTES are pending. Call flush_logs() to write pending
+        messages now. Safe to call from several threads.
         """
         # Always print to console
         print(message)
@@ -162,29 +372,39 @@ class Job(BaseLabResource):
         if not message_str.endswith("\n"):
             message_str = message_str + "\n"
 
-        # Read existing content, append new message, and write back to log file
         try:
-            log_path = self.get_log_path()
-            storage.makedirs(posixpath.dirname(log_path), exist_ok=True)
-            
-            # Read existing content if file exists
-            existing_content = ""
-            if storage.exists(log_path):
-                with storage.open(log_path, "r", encoding="utf-8") as f:
-                    existing_content = f.read()
-            
-            # Append new message to existing content on a new line
-            if existing_content and not existing_content.endswith("\n"):
-                existing_content += "\n"
-            new_content = existing_content + message_str
-            
-            # Write back the complete content
-            with storage.open(log_path, "w", encoding="utf-8") as f:
-                f.write(new_content)
-                f.flush()
+            if self._log_path is None:
+                self._log_path = self.get_log_path()
         except Exception:
             # Best-effort file logging; ignore file errors to avoid crashing job
-            pass
+            return
+        log_path = self._log_path
+        buf = _log_buffer_for(log_path)
+        with buf.lock:
+            buf.lines.append(message_str)
+            buf.nbytes += len(message_str)
+            wait = self.LOG_FLUSH_INTERVAL - (time.monotonic() - buf.last_flush)
+            flush_now = buf.nbytes >= self.LOG_FLUSH_BYTES or wait <= 0
+            if not flush_now and buf.timer is None:
+                buf.timer = threading.Timer(wait, _flush_log_buffer, (log_path, buf))
+                buf.timer.daemon = True
+                buf.timer.start()
+        if flush_now:
+            _flush_log_buffer(log_path, buf)
+
+    def flush_logs(self):
+        """
+        Write any buffered log messages to the output log file.
+        """
+        if self._log_path is None:
+            if not _log_buffers:
+                return
+            # Another handle on this job may have buffered lines
+            try:
+                self._log_path = self.get_log_path()
+            except Exception:
+                return
+        _flush_log_buffer(self._log_path, _log_buffer_for(self._log_path))
 
     def set_type(self, job_type: str):
         """
@@ -266,13 +486,25 @@ class Job(BaseLabResource):
         """
         Get the checkpoints directory path for this job.
         """
-        return dirs.get_job_checkpoints_dir(self.id)
+        if self._checkpoints_dir is None:
+            self._checkpoints_dir = dirs.get_job_checkpoints_dir(self.id)
+        return self._checkpoints_dir
     
     def get_artifacts_dir(self):
         """
         Get the artifacts directory path for this job.
         """
-        return dirs.get_job_artifacts_dir(self.id)
+        if self._artifacts_dir is None:
+            self._artifacts_dir = dirs.get_job_artifacts_dir(self.id)
+        return self._artifacts_dir
+
+    def get_eval_results_dir(self):
+        """
+        Get the eval results directory path for this job.
+        """
+        if self._eval_results_dir is None:
+            self._eval_results_dir = dirs.get_job_eval_results_dir(self.id)
+        return self._eval_results_dir
     
     def get_checkpoint_paths(self):
         """
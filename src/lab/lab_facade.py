@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import copy
 import time
 from typing import Optional, Dict, Any, Union
+import logging
 import os
 import io
+import json
+import sys
 import posixpath
+from concurrent.futures import ThreadPoolExecutor
 
 from .experiment import Experiment
 from .job import Job
@@ -13,6 +18,9 @@ from .model import Model as ModelService
 from . import storage
 from .dataset import Dataset
 
+logger = logging.getLogger(__name__)
+
+
 class Lab:
     """
     Simple facade over Experiment and Job for easy usage:
@@ -24,9 +32,29 @@ class Lab:
     lab.finish("success")
     """
 
+    # How many log/progress calls to skip between wandb.run probes
+    WANDB_RECHECK_INTERVAL = 64
+
+    # Scores larger than this (serialized) are stored in a file, not in job_data
+    SCORE_INLINE_MAX_BYTES = 16 * 1024
+    # Reserved file beside the job's index.json, kept out of artifacts/ so it
+    # cannot collide with a user artifact
+    SCORE_FILE_NAME = ".tlab_score.json"
+
     def __init__(self) -> None:
         self._experiment: Optional[Experiment] = None
         self._job: Optional[Job] = None
+        # job_data as last read or written by this instance
+        self._job_data_cache: Optional[Dict[str, Any]] = None
+        # wandb URL detection: 0 = not checked, 1 = captured, -1 = not found yet
+        self._wandb_state = 0
+        self._wandb_checks = 0
+        # Whether wandb was already imported at the last probe
+        self._wandb_module_seen = False
+        # Background threads for model checksums/provenance files (created on first use)
+        self._provenance_writer: Optional[ThreadPoolExecutor] = None
+        # Workspace models directory, resolved on the first model save after init()
+        self._models_dir: Optional[str] = None
 
     # ------------- lifecycle -------------
     def init(self, experiment_id: str = "alpha", config: Optional[Dict[str, Any]] = None) -> None:
@@ -35,6 +63,13 @@ class Lab:
         If _TFL_JOB_ID environment variable is set, uses that existing job.
         Otherwise, creates the experiment structure if needed and creates a new job.
         """
+        self._close_background_writers()
+        self._job_data_cache = None
+        self._models_dir = None
+        self._wandb_state = 0
+        self._wandb_checks = 0
+        self._wandb_module_seen = False
+
         # Check if we should use an existing job from environment variable
         existing_job_id = os.environ.get('_TFL_JOB_ID')
         
@@ -42,20 +77,25 @@ class Lab:
             # Use existing job from environment variable
             # This will raise an error if the job doesn't exist
             self._experiment = Experiment(experiment_id, create_new=False)
-            self._job = Job.get(existing_job_id)
-            if self._job is None:
+            job = Job.get(existing_job_id)
+            if job is None:
                 raise RuntimeError(f"Job with ID {existing_job_id} not found. Check _TFL_JOB_ID environment variable.")
+            self._job = job
             print(f"Using existing job ID: {existing_job_id}")
         else:
             # Create new job as before
             self._experiment = Experiment(experiment_id, create_new=True)
-            self._job = self._experiment.create_job()
-            self._job.update_job_data_field("start_time", time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime()))
-            self._job.set_experiment(experiment_id)
-            print(f"Created new job ID: {self._job.id}")
+            # create_job already associates the job with this experiment
+            job = self._job = self._experiment.create_job()
+            job.update_job_data_field("start_time", time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime()))
+            print(f"Created new job ID: {job.id}")
         
         # Update status to RUNNING for both cases
-        self._job.update_status("RUNNING")
+        job.update_status("RUNNING")
+
+        # Seed the job_data cache used by the save_* helpers
+        if self._get_cached_job_data().get("wandb_run_url"):
+            self._wandb_state = 1
         
         # Check for wandb integration and capture URL if available
         self._detect_and_capture_wandb_url()
@@ -68,30 +108,44 @@ class Lab:
         """
         Attach configuration to the current job.
         """
-        self._ensure_initialized()
+        job = self._ensure_initialized()
         # Ensure experiment_name present for downstream consumers
         if isinstance(config, dict) and "experiment_name" not in config and self._experiment is not None:
             config = {**config, "experiment_name": self._experiment.id}
-        # keep the existing config with fields that are not in the new config
-        config_old = self._job.get_job_data()
-        config_new = {**config_old, **config}
-        self._job.set_job_data(config_new)  # type: ignore[union-attr]
+        # Nothing to write if every key already holds the same value (e.g. a
+        # tuning loop passing the same config again)
+        config_old = self._get_cached_job_data()
+        if all(key in config_old and config_old[key] == value for key, value in config.items()):
+            return
+        # Merge into freshly read job_data, keeping fields that are not in the
+        # new config, including ones written since the cache was filled
+        job.update_job_data_fields(config)
+        self._job_data_cache = None
 
     # ------------- convenience logging -------------
     def log(self, message: str) -> None:
-        self._ensure_initialized()
-        self._job.log_info(message)  # type: ignore[union-attr]
+        # Hot path: one check on the job instead of a full _ensure_initialized call
+        job = self._job
+        if job is None:
+            job = self._ensure_initialized()
+        job.log_info(message)
         # Check for wandb URL on every log operation
-        self._check_and_capture_wandb_url()
+        # (skipping the call entirely once the URL is captured)
+        if self._wandb_state != 1:
+            self._check_and_capture_wandb_url()
 
     def update_progress(self, progress: int) -> None:
         """
         Update job progress and check for wandb URL detection.
         """
-        self._ensure_initialized()
-        self._job.update_progress(progress)  # type: ignore[union-attr]
+        job = self._job
+        if job is None:
+            job = self._ensure_initialized()
+        job.update_progress(progress)
         # Check for wandb URL on every progress update
-        self._check_and_capture_wandb_url()
+        # (skipping the call entirely once the URL is captured)
+        if self._wandb_state != 1:
+            self._check_and_capture_wandb_url()
 
     # ------------- checkpoint resume support -------------
     def get_checkpoint_to_resume(self) -> Optional[str]:
@@ -108,7 +162,7 @@ class Lab:
         if not self._job:
             return None
             
-        job_data = self._job.get_job_data()
+        job_data = self._get_cached_job_data()
         if not job_data:
             return None
         
@@ -160,7 +214,7 @@ class Lab:
             
             return None
         except Exception as e:
-            print(f"Error getting parent job checkpoint path: {str(e)}")
+            logger.error("Error getting parent job checkpoint path: %s", e)
             return None
 
     # ------------- completion -------------
@@ -170,28 +224,65 @@ class Lab:
         score: Optional[Dict[str, Any]] = None,
         additional_output_path: Optional[str] = None,
         plot_data_path: Optional[str] = None,
+        offload_score: bool = False,
     ) -> None:
         """
         Mark the job as successfully completed and set completion metadata.
+
+        By default the score is stored in job_data as given. With
+        offload_score=True a score larger than SCORE_INLINE_MAX_BYTES is
+        written to a file instead and job_data["score"] becomes a reference
+        {"$ref": <path>, "keys": [...]}; readers of job_data must then load it
+        themselves, or use get_score().
         """
-        self._ensure_initialized()
-        self._job.update_progress(100)  # type: ignore[union-attr]
-        self._job.update_status("COMPLETE")  # type: ignore[union-attr]
-        self._job.update_job_data_field("completion_status", "success")  # type: ignore[union-attr]
-        self._job.update_job_data_field("completion_details", message)  # type: ignore[union-attr]
-        if score is not None:
-            self._job.update_job_data_field("score", score)  # type: ignore[union-attr]
-        if additional_output_path is not None and additional_output_path.strip() != "":
-            self._job.update_job_data_field("additional_output_path", additional_output_path)  # type: ignore[union-attr]
-        if plot_data_path is not None and plot_data_path.strip() != "":
-            self._job.update_job_data_field("plot_data_path", plot_data_path)  # type: ignore[union-attr]
+        job = self._ensure_initialized()
+        # Last chance to record a wandb run started since the previous probe
+        if self._wandb_state != 1:
+            self._check_and_capture_wandb_url(force=True)
+        job.flush_logs()
+        self._close_background_writers()
+        if score is not None and offload_score:
+            score = self._offload_large_score(job, score)
+        job.set_job_completion_status(
+            "success",
+            message,
+            score=score,
+            additional_output_path=additional_output_path,
+            plot_data_path=plot_data_path,
+            progress=100,
+            status="COMPLETE",
+        )
+        self._job_data_cache = None
+
+    def _offload_large_score(self, job: Job, score: Any) -> Any:
+        """
+        Keep job_data small: a score larger than SCORE_INLINE_MAX_BYTES is written
+        to SCORE_FILE_NAME in the job's directory and replaced by a reference
+        {"$ref": <path>, "keys": [...]}. Smaller scores are returned unchanged.
+        get_score() resolves the reference.
+        """
+        try:
+            serialized = json.dumps(score)
+        except (TypeError, ValueError):
+            return score
+        if len(serialized) <= self.SCORE_INLINE_MAX_BYTES:
+            return score
+
+        score_path = storage.join(job.get_dir(), self.SCORE_FILE_NAME)
+        with storage.open(score_path, "wb") as f:
+            f.write(serialized.encode("utf-8"))
+        ref: Dict[str, Any] = {"$ref": score_path}
+        if isinstance(score, dict):
+            ref["keys"] = list(score.keys())
+        return ref
 
     def save_artifact(
         self, 
         source_path: Union[str, Any], 
         name: Optional[str] = None,
         type: Optional[str] = None,
-        config: Optional[Dict[str, Any]] = None
+        config: Optional[Dict[str, Any]] = None,
+        overwrite: str = "replace",
     ) -> str:
         """
         Save an artifact file or directory into this job's artifacts folder.
@@ -213,31 +304,30 @@ class Lab:
                    {"evals": {"input": "input_col", "output": "output_col", 
                              "expected_output": "expected_col", "score": "score_col"}}
                    When type="dataset", can contain:
-                   {"dataset": {...metadata...}, "suffix": "...", "is_image": bool}
+                   {"dataset": {...metadata...}, "suffix": "...", "is_image": bool,
+                    "format": "json" | "jsonl" | "parquet"}
                    When type="model", can contain:
                    {"model": {"architecture": "...", "pipeline_tag": "...", "parent_model": "..."}}
                    or top-level keys: {"architecture": "...", "pipeline_tag": "...", "parent_model": "..."}
+            overwrite: How to save a directory over an existing destination of the same name.
+                   "replace" (default) deletes the old directory first; "merge" copies into it
+                   in place, overwriting files with the same name and keeping any others.
         
         Returns:
             The destination path on disk.
         """
-        self._ensure_initialized()
+        job = self._ensure_initialized()
+        _check_overwrite_mode(overwrite)
         
-        job_id = self._job.id  # type: ignore[union-attr]
+        job_id = job.id
         
         # Handle DataFrame input when type="dataset"
         if type == "dataset" and hasattr(source_path, "to_json"):
-            # Normalize input: convert Hugging Face datasets.Dataset to pandas DataFrame
+            # save_dataset converts Hugging Face datasets to pandas where needed
             df = source_path
-            try:
-                if hasattr(df, "to_pandas") and callable(getattr(df, "to_pandas")):
-                    df = df.to_pandas()
-            except Exception:
-                pass
             
             # Use name as dataset_id, or generate one if not provided
             if name is None or (isinstance(name, str) and name.strip() == ""):
-                import time
                 timestamp = time.strftime("%Y%m%d_%H%M%S")
                 dataset_id = f"generated_dataset_{job_id}_{timestamp}"
             else:
@@ -251,11 +341,14 @@ class Lab:
             # Get other parameters from config
             suffix = None
             is_image = False
+            dataset_format = "json"
             if config and isinstance(config, dict):
                 if "suffix" in config:
                     suffix = config["suffix"]
                 if "is_image" in config:
                     is_image = config["is_image"]
+                if "format" in config:
+                    dataset_format = config["format"]
             
             # Use the existing save_dataset method
             output_path = self.save_dataset(
@@ -263,19 +356,13 @@ class Lab:
                 dataset_id=dataset_id,
                 additional_metadata=additional_metadata if additional_metadata else None,
                 suffix=suffix,
-                is_image=is_image
+                is_image=is_image,
+                format=dataset_format,
             )
             
             # Track dataset_id in job_data
             try:
-                job_data = self._job.get_job_data()
-                generated_datasets_list = []
-                if isinstance(job_data, dict):
-                    existing = job_data.get("generated_datasets", [])
-                    if isinstance(existing, list):
-                        generated_datasets_list = existing
-                generated_datasets_list.append(dataset_id)
-                self._job.update_job_data_field("generated_datasets", generated_datasets_list)
+                self._append_job_data_list("generated_datasets", dataset_id)
             except Exception:
                 pass
             
@@ -321,10 +408,9 @@ class Lab:
                 raise ValueError(f"Missing required columns in DataFrame: {missing_columns}")
             
             # Determine destination directory and filename
-            dest_dir = dirs.get_job_eval_results_dir(job_id)
+            dest_dir = job.get_eval_results_dir()
             
             if name is None or (isinstance(name, str) and name.strip() == ""):
-                import time
                 timestamp = time.strftime("%Y%m%d_%H%M%S")
                 filename = f"eval_results_{job_id}_{timestamp}.csv"
             else:
@@ -332,9 +418,6 @@ class Lab:
             
             dest = storage.join(dest_dir, filename)
             
-            # Create parent directories
-            storage.makedirs(dest_dir, exist_ok=True)
-            
             # Save DataFrame to CSV using storage module
             try:
                 if not hasattr(df, "to_csv"):
@@ -351,14 +434,7 @@ class Lab:
             
             # Track in job_data
             try:
-                job_data = self._job.get_job_data()
-                eval_results_list = []
-                if isinstance(job_data, dict):
-                    existing = job_data.get("eval_results", [])
-                    if isinstance(existing, list):
-                        eval_results_list = existing
-                eval_results_list.append(dest)
-                self._job.update_job_data_field("eval_results", eval_results_list)
+                self._append_job_data_list("eval_results", dest)
             except Exception:
                 pass
             
@@ -367,14 +443,7 @@ class Lab:
         
         # Handle file path input when type="model"
         if type == "model":
-            if not isinstance(source_path, str) or source_path.strip() == "":
-                raise ValueError("source_path must be a non-empty string when type='model'")
-            src = source_path
-            # For local paths, resolve to absolute path; for remote paths (s3://, etc.), use as-is
-            if not src.startswith(("s3://", "gs://", "abfs://", "gcs://", "http://", "https://")):
-                src = os.path.abspath(src)
-            if not storage.exists(src):
-                raise FileNotFoundError(f"Model source does not exist: {src}")
+            src, src_type = _resolve_source(source_path, "Model", "when type='model'")
             
             # Get model-specific parameters from config
             model_config = {}
@@ -407,19 +476,13 @@ class Lab:
                 base_name = f"{job_id}_{posixpath.basename(src)}"
             
             # Save to main workspace models directory for Model Zoo visibility
-            models_dir = dirs.get_models_dir()
-            dest = storage.join(models_dir, base_name)
-            
-            # Create parent directories
-            storage.makedirs(models_dir, exist_ok=True)
+            # (get_models_dir creates the directory)
+            if self._models_dir is None:
+                self._models_dir = dirs.get_models_dir()
+            dest = storage.join(self._models_dir, base_name)
             
             # Copy file or directory using storage module
-            if storage.isdir(src):
-                if storage.exists(dest):
-                    storage.rm_tree(dest)
-                storage.copy_dir(src, dest)
-            else:
-                storage.copy_file(src, dest)
+            _copy_source(src, src_type, dest, overwrite)
             
             # Initialize model service for metadata and provenance creation
             model_service = ModelService(base_name)
@@ -436,7 +499,7 @@ class Lab:
                     pipeline_tag = model_service.fetch_pipeline_tag(parent_model)
                 
                 # Determine model_filename for single-file models
-                model_filename = "" if storage.isdir(dest) else posixpath.basename(dest)
+                model_filename = "" if src_type == "directory" else posixpath.basename(dest)
                 
                 # Prepare json_data with basic info
                 json_data = {
@@ -464,111 +527,126 @@ class Lab:
                     except Exception:
                         pass
             
-            # Create provenance data
-            try:
-                # Create MD5 checksums for all model files
-                md5_objects = model_service.create_md5_checksums(dest)
-                
-                # Prepare provenance metadata from job data
-                job_data = self._job.get_job_data()
-                
-                provenance_metadata = {
-                    "job_id": job_id,
-                    "model_name": parent_model or job_data.get("model_name"),
-                    "model_architecture": architecture,
-                    "input_model": parent_model,
-                    "dataset": job_data.get("dataset"),
-                    "adaptor_name": job_data.get("adaptor_name", None),
-                    "parameters": job_data.get("_config", {}),
-                    "start_time": job_data.get("start_time", time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())),
-                    "end_time": time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime()),
-                    "md5_checksums": md5_objects,
-                }
-                
-                # Create the _tlab_provenance.json file
-                provenance_file = model_service.create_provenance_file(
-                    model_path=dest,
-                    model_name=base_name,
-                    model_architecture=architecture,
-                    md5_objects=md5_objects,
-                    provenance_data=provenance_metadata
-                )
-                self.log(f"Provenance file created at: {provenance_file}")
-            except Exception as e:
-                self.log(f"Warning: Model saved but provenance creation failed: {str(e)}")
-            
             # Track in job_data
             try:
-                job_data = self._job.get_job_data()
-                model_list = []
-                if isinstance(job_data, dict):
-                    existing = job_data.get("models", [])
-                    if isinstance(existing, list):
-                        model_list = existing
-                model_list.append(dest)
-                self._job.update_job_data_field("models", model_list)
+                self._append_job_data_list("models", dest)
             except Exception:
                 pass
             
+            # Prepare provenance metadata from job data
+            job_data = self._get_cached_job_data()
+            provenance_metadata = {
+                "job_id": job_id,
+                "model_name": parent_model or job_data.get("model_name"),
+                "model_architecture": architecture,
+                "input_model": parent_model,
+                "dataset": job_data.get("dataset"),
+                "adaptor_name": job_data.get("adaptor_name", None),
+                "parameters": job_data.get("_config", {}),
+                "start_time": job_data.get("start_time", time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())),
+            }
+            
+            # Hashing a large model takes a while, so the checksums and the
+            # provenance file are written in the background (finish() waits for them)
+            if self._provenance_writer is None:
+                self._provenance_writer = ThreadPoolExecutor(max_workers=2, thread_name_prefix="lab-provenance")
+            # A copy, so later set_config() calls can't change it mid-write
+            self._provenance_writer.submit(
+                _write_model_provenance,
+                job,
+                model_service,
+                dest,
+                base_name,
+                architecture,
+                copy.deepcopy(provenance_metadata),
+            )
+            
             return dest
         
         # Handle file path input (original behavior)
-        if not isinstance(source_path, str) or source_path.strip() == "":
-            raise ValueError("source_path must be a non-empty string")
-        src = source_path
-        # For local paths, resolve to absolute path; for remote paths (s3://, etc.), use as-is
-        if not src.startswith(("s3://", "gs://", "abfs://", "gcs://", "http://", "https://")):
-            src = os.path.abspath(src)
-        if not storage.exists(src):
-            raise FileNotFoundError(f"Artifact source does not exist: {src}")
-
-        # Determine destination directory based on type
+        src, src_type = _resolve_source(source_path, "Artifact")
+
+        # Determine destination directory based on type (the job creates it on first use)
         if type == "evals":
-            dest_dir = dirs.get_job_eval_results_dir(job_id)
+            dest_dir = job.get_eval_results_dir()
         else:
-            dest_dir = dirs.get_job_artifacts_dir(job_id)
+            dest_dir = job.get_artifacts_dir()
         
         base_name = name if (isinstance(name, str) and name.strip() != "") else posixpath.basename(src)
         dest = storage.join(dest_dir, base_name)
 
-        # Create parent directories
-        storage.makedirs(dest_dir, exist_ok=True)
-
         # Copy file or directory
-        if storage.isdir(src):
-            if storage.exists(dest):
-                storage.rm_tree(dest)
-            storage.copy_dir(src, dest)
-        else:
-            storage.copy_file(src, dest)
+        _copy_source(src, src_type, dest, overwrite)
 
         # Track in job_data based on type
         try:
-            job_data = self._job.get_job_data()
             if type == "evals":
                 # For eval results, track in eval_results list
-                eval_results_list = []
-                if isinstance(job_data, dict):
-                    existing = job_data.get("eval_results", [])
-                    if isinstance(existing, list):
-                        eval_results_list = existing
-                eval_results_list.append(dest)
-                self._job.update_job_data_field("eval_results", eval_results_list)
+                self._append_job_data_list("eval_results", dest)
             else:
                 # For regular artifacts, track in artifacts list
-                artifact_list = []
-                if isinstance(job_data, dict):
-                    existing = job_data.get("artifacts", [])
-                    if isinstance(existing, list):
-                        artifact_list = existing
-                artifact_list.append(dest)
-                self._job.update_job_data_field("artifacts", artifact_list)
+                self._append_job_data_list("artifacts", dest)
         except Exception:
             pass
 
         return dest
 
-    def save_dataset(self, df, dataset_id: str, additional_metadata: Optional[Dict[str, Any]] = None, suffix: Optional[str] = None, is_image: bool = False) -> str:
+    def save_artifacts_batch(
+        self,
+        paths: list[tuple[Union[str, os.PathLike], Optional[str]]],
+        overwrite: str = "replace",
+    ) -> list[str]:
+        """
+        Save several artifact files or directories into this job's artifacts folder.
+
+        Args:
+            paths: (source_path, name) pairs; name may be None to use the source basename.
+            overwrite: As in save_artifact ("replace" or "merge").
+
+        All sources are checked before anything is copied, and the destination
+        names must be unique (ValueError otherwise). The copies run in parallel
+        (TFL_COPY_PARALLELISM threads) and the artifacts are tracked in
+        job_data with a single write.
+
+        Returns:
+            The destination paths, in the same order as paths.
+        """
+        job = self._ensure_initialized()
+        _check_overwrite_mode(overwrite)
+
+        copies = []
+        for source_path, name in paths:
+            src, src_type = _resolve_source(source_path, "Artifact")
+            base_name = name if (isinstance(name, str) and name.strip() != "") else posixpath.basename(src)
+            copies.append((src, src_type, base_name))
+        if not copies:
+            return []
+        # Parallel copies to the same destination would overwrite each other
+        seen: set[str] = set()
+        for _, _, base_name in copies:
+            if base_name in seen:
+                raise ValueError(f"Duplicate artifact name in batch: {base_name}")
+            seen.add(base_name)
+
+        dest_dir = job.get_artifacts_dir()
+
+        def copy_one(item: tuple[str, str, str]) -> str:
+            src, src_type, base_name = item
+            dest = storage.join(dest_dir, base_name)
+            _copy_source(src, src_type, dest, overwrite)
+            return dest
+
+        with ThreadPoolExecutor(max_workers=min(storage._copy_workers(), len(copies))) as pool:
+            dests = list(pool.map(copy_one, copies))
+
+        try:
+            self._extend_job_data_list("artifacts", dests)
+        except Exception as e:
+            logger.warning("Failed to track artifacts in job_data: %s", e)
+
+        return dests
+
+    def save_dataset(self, df, dataset_id: str, additional_metadata: Optional[Dict[str, Any]] = None, suffix: Optional[str] = None, is_image: bool = False, format: str = "json") -> str:
         """
         Save a dataset under the workspace datasets directory and mark it as generated.
 
@@ -578,6 +656,10 @@ class Lab:
             additional_metadata: Optional dict to merge into dataset json_data.
             suffix: Optional suffix to append to the output filename stem.
             is_image: If True, save JSON Lines (for image metadata-style rows).
+            format: "json" (default), "jsonl", or "parquet". Parquet is written with
+                    pyarrow and zstd compression, and is much faster to write and
+                    smaller on disk for large datasets; it requires pyarrow.
+                    Ignored when is_image is True.
 
         Returns:
             The path to the saved dataset file on disk.
@@ -585,13 +667,18 @@ class Lab:
         self._ensure_initialized()
         if not isinstance(dataset_id, str) or dataset_id.strip() == "":
             raise ValueError("dataset_id must be a non-empty string")
+        if format not in ("json", "jsonl", "parquet"):
+            raise ValueError(f"format must be 'json', 'jsonl' or 'parquet', got {format!r}")
 
-        # Normalize input: convert Hugging Face datasets.Dataset to pandas DataFrame
-        try:
-            if hasattr(df, "to_pandas") and callable(getattr(df, "to_pandas")):
-                df = df.to_pandas()
-        except Exception as e:
-            print(f"Warning: Failed to convert dataset to pandas DataFrame: {str(e)}")
+        # Normalize input: convert Hugging Face datasets.Dataset to pandas DataFrame.
+        # Parquet is written straight from Arrow-backed data (datasets.Dataset,
+        # pyarrow.Table), so those skip the conversion.
+        if format != "parquet" or not _is_arrow_backed(df):
+            try:
+                if hasattr(df, "to_pandas") and callable(getattr(df, "to_pandas")):
+                    df = df.to_pandas()
+            except Exception as e:
+                logger.warning("Failed to convert dataset to pandas DataFrame: %s", e)
 
         # Prepare dataset directory
         dataset_id_safe = dataset_id.strip()
@@ -603,28 +690,43 @@ class Lab:
 
         # Determine output filename
         if is_image:
-            lines = True
+            format = "jsonl"
             output_filename = "metadata.jsonl"
         else:
-            lines = False
             stem = dataset_id_safe
             if isinstance(suffix, str) and suffix.strip() != "":
                 stem = f"{stem}_{suffix.strip()}"
-            output_filename = f"{stem}.json"
+            output_filename = f"{stem}.{format}"
 
         output_path = storage.join(dataset_dir, output_filename)
 
         # Persist dataframe
         try:
-            if not hasattr(df, "to_json"):
-                raise TypeError("df must be a pandas DataFrame or a Hugging Face datasets.Dataset")
-            # Write DataFrame to StringIO buffer first (pandas doesn't support fsspec handles directly)
-            buffer = io.StringIO()
-            df.to_json(buffer, orient="records", lines=lines)
-            buffer.seek(0)
-            # Then write buffer content to storage
-            with storage.open(output_path, "w", encoding="utf-8") as f:
-                f.write(buffer.getvalue())
+            if format == "parquet":
+                # Columnar write in pyarrow; serialize to bytes first as with JSON below
+                buffer = io.BytesIO()
+                if _is_pyarrow_table(df):
+                    import pyarrow.parquet as pq
+                    pq.write_table(df, buffer, compression="zstd")
+                elif _is_hf_dataset(df):
+                    # Written from the dataset's Arrow table (respecting any select/shuffle)
+                    df.to_parquet(buffer, compression="zstd")
+                elif hasattr(df, "to_parquet"):
+                    df.to_parquet(buffer, engine="pyarrow", compression="zstd", index=False)
+                else:
+                    raise TypeError("df must be a pandas DataFrame or a Hugging Face datasets.Dataset")
+                with storage.open(output_path, "wb") as f:
+                    f.write(buffer.getbuffer())
+            else:
+                if not hasattr(df, "to_json"):
+                    raise TypeError("df must be a pandas DataFrame or a Hugging Face datasets.Dataset")
+                # Write DataFrame to StringIO buffer first (pandas doesn't support fsspec handles directly)
+                buffer = io.StringIO()
+                df.to_json(buffer, orient="records", lines=format == "jsonl")
+                buffer.seek(0)
+                # Then write buffer content to storage
+                with storage.open(output_path, "w", encoding="utf-8") as f:
+                    f.write(buffer.getvalue())
         except Exception as e:
             raise RuntimeError(f"Failed to save dataset to {output_path}: {str(e)}")
 
@@ -652,65 +754,44 @@ class Lab:
             )
         except Exception as e:
             # Do not fail the save if metadata write fails; log to job data
-            print(f"Warning: Failed to create dataset metadata: {str(e)}")
+            logger.warning("Failed to create dataset metadata: %s", e)
             try:
-                self._job.update_job_data_field("dataset_metadata_error", str(e))  # type: ignore[union-attr]
+                self._set_job_data_field("dataset_metadata_error", str(e))
             except Exception as e2:
-                print(f"Warning: Failed to log dataset metadata error: {str(e2)}")
+                logger.warning("Failed to log dataset metadata error: %s", e2)
 
         # Track dataset on the job for provenance
         try:
-            self._job.update_job_data_field("dataset_id", dataset_id_safe)  # type: ignore[union-attr]
+            self._set_job_data_field("dataset_id", dataset_id_safe)
         except Exception as e:
-            print(f"Warning: Failed to track dataset in job_data: {str(e)}")
+            logger.warning("Failed to track dataset in job_data: %s", e)
 
         self.log(f"Dataset saved to '{output_path}' and registered as generated dataset '{dataset_id_safe}'")
         return output_path
 
-    def save_checkpoint(self, source_path: str, name: Optional[str] = None) -> str:
+    def save_checkpoint(self, source_path: Union[str, os.PathLike], name: Optional[str] = None, overwrite: str = "replace") -> str:
         """
         Save a checkpoint file or directory into this job's checkpoints folder.
+        overwrite works as in save_artifact ("replace" or "merge").
         Returns the destination path on disk.
         """
-        self._ensure_initialized()
-        if not isinstance(source_path, str) or source_path.strip() == "":
-            raise ValueError("source_path must be a non-empty string")
-        src = source_path
-        # For local paths, resolve to absolute path; for remote paths (s3://, etc.), use as-is
-        if not src.startswith(("s3://", "gs://", "abfs://", "gcs://", "http://", "https://")):
-            src = os.path.abspath(src)
-        if not storage.exists(src):
-            raise FileNotFoundError(f"Checkpoint source does not exist: {src}")
-
-        job_id = self._job.id  # type: ignore[union-attr]
-        ckpts_dir = dirs.get_job_checkpoints_dir(job_id)
+        job = self._ensure_initialized()
+        _check_overwrite_mode(overwrite)
+        src, src_type = _resolve_source(source_path, "Checkpoint")
+
+        # The job creates the directory on first use
+        ckpts_dir = job.get_checkpoints_dir()
         base_name = name if (isinstance(name, str) and name.strip() != "") else posixpath.basename(src)
         dest = storage.join(ckpts_dir, base_name)
 
-        # Create parent directories
-        storage.makedirs(ckpts_dir, exist_ok=True)
-
         # Copy file or directory
-        if storage.isdir(src):
-            if storage.exists(dest):
-                storage.rm_tree(dest)
-            storage.copy_dir(src, dest)
-        else:
-            storage.copy_file(src, dest)
+        _copy_source(src, src_type, dest, overwrite)
 
         # Track in job_data and update latest pointer
         try:
-            job_data = self._job.get_job_data()
-            ckpt_list = []
-            if isinstance(job_data, dict):
-                existing = job_data.get("checkpoints", [])
-                if isinstance(existing, list):
-                    ckpt_list = existing
-            ckpt_list.append(dest)
-            self._job.update_job_data_field("checkpoints", ckpt_list)
-            self._job.update_job_data_field("latest_checkpoint", dest)
+            self._append_job_data_list("checkpoints", dest, updates={"latest_checkpoint": dest})
         except Exception as e:
-            print(f"Warning: Failed to track checkpoint in job_data: {str(e)}")
+            logger.warning("Failed to track checkpoint in job_data: %s", e)
 
         return dest
 
@@ -759,91 +840,65 @@ class Lab:
         """
         Mark the job as failed and set completion metadata.
         """
-        self._ensure_initialized()
-        self._job.update_status("COMPLETE")  # type: ignore[union-attr]
-        self._job.update_job_data_field("completion_status", "failed")  # type: ignore[union-attr]
-        self._job.update_job_data_field("completion_details", message)  # type: ignore[union-attr]
-        self._job.update_job_data_field("status", "FAILED")  # type: ignore[union-attr]
+        job = self._ensure_initialized()
+        if self._wandb_state != 1:
+            self._check_and_capture_wandb_url(force=True)
+        job.flush_logs()
+        self._close_background_writers()
+        job.set_job_completion_status("failed", message, status="COMPLETE")
+        self._job_data_cache = None
 
     def _detect_and_capture_wandb_url(self) -> None:
         """
-        Detect wandb run URLs from various sources and store them in job data.
-        This method checks for wandb integration in multiple ways:
-        1. Environment variables set by wandb
-        2. Active wandb runs in the current process
-        3. TRL trainer integrations
+        Detect wandb run URLs and store them in job data.
+        Checks the WANDB_URL environment variable, then the active wandb run
+        in the current process (which also covers TRL trainer integrations).
         """
         try:
-            # Method 1: Check environment variables set by wandb
-            wandb_url = os.environ.get('WANDB_URL')
+            self._wandb_module_seen = sys.modules.get("wandb") is not None
+            wandb_url = _probe_wandb_url()
             if wandb_url:
-                self._job.update_job_data_field("wandb_run_url", wandb_url)
-                print(f"📊 Detected wandb run URL: {wandb_url}")
+                self._record_wandb_url(wandb_url, "Detected wandb run URL")
                 return
-            
-            # Method 2: Check for active wandb run in current process
-            try:
-                import wandb
-                if wandb.run is not None:
-                    wandb_url = wandb.run.url
-                    if wandb_url:
-                        self._job.update_job_data_field("wandb_run_url", wandb_url)
-                        print(f"📊 Detected wandb run URL: {wandb_url}")
-                        return
-            except ImportError:
-                pass
-            
-            # Method 3: Check for wandb in TRL trainers or other frameworks
-            # Look for wandb integration in global variables or modules
-            try:
-                import wandb
-                # Check if there's a wandb run that was initialized elsewhere
-                if hasattr(wandb, 'api') and wandb.api and wandb.api.api_key:
-                    # If wandb is configured, try to get the current run
-                    current_run = wandb.run
-                    if current_run and hasattr(current_run, 'url'):
-                        wandb_url = current_run.url
-                        if wandb_url:
-                            self._job.update_job_data_field("wandb_run_url", wandb_url)
-                            print(f"📊 Detected wandb run URL: {wandb_url}")
-                            return
-            except (ImportError, AttributeError):
-                pass
-                
+            self._wandb_state = -1
         except Exception:
             # Silently fail - wandb detection is optional
             pass
 
-    def _check_and_capture_wandb_url(self) -> None:
+    def _check_and_capture_wandb_url(self, force: bool = False) -> None:
         """
         Check for wandb run URLs and capture them in job data.
-        This is called automatically on every log and progress update operation.
+        This is called automatically on every log and progress update operation,
+        so once a URL is captured it returns immediately, and while none has been
+        found wandb.run is only re-probed every WANDB_RECHECK_INTERVAL calls, or
+        right away on the first call after the script imports wandb.
+        force probes wandb.run regardless (used by finish() and error()).
         """
+        if self._wandb_state == 1:
+            return
         try:
-            # Only check if we haven't already captured a wandb URL
-            job_data = self._job.get_job_data()
-            if job_data.get("wandb_run_url"):
-                return  # Already have a wandb URL
-            
             # Method 1: Check environment variables
-            wandb_url = os.environ.get('WANDB_URL')
+            wandb_url = _probe_wandb_url(check_run=False)
             if wandb_url:
-                self._job.update_job_data_field("wandb_run_url", wandb_url)
-                print(f"📊 Auto-detected wandb URL from environment: {wandb_url}")
+                self._record_wandb_url(wandb_url, "Auto-detected wandb URL from environment")
                 return
-            
+
+            # Throttle, unless wandb was imported since the last probe
+            if self._wandb_state == -1 and not force and (
+                self._wandb_module_seen or sys.modules.get("wandb") is None
+            ):
+                self._wandb_checks += 1
+                if self._wandb_checks % self.WANDB_RECHECK_INTERVAL != 0:
+                    return
+
             # Method 2: Check active wandb run
-            try:
-                import wandb
-                if wandb.run is not None and hasattr(wandb.run, 'url'):
-                    wandb_url = wandb.run.url
-                    if wandb_url:
-                        self._job.update_job_data_field("wandb_run_url", wandb_url)
-                        print(f"📊 Auto-detected wandb URL from wandb.run: {wandb_url}")
-                        return
-            except ImportError:
-                pass
-                
+            self._wandb_module_seen = sys.modules.get("wandb") is not None
+            wandb_url = _probe_wandb_url(check_env=False)
+            if wandb_url:
+                self._record_wandb_url(wandb_url, "Auto-detected wandb URL from wandb.run")
+                return
+
+            self._wandb_state = -1
         except Exception:
             # Silently fail - wandb detection is optional
             pass
@@ -855,46 +910,128 @@ class Lab:
         """
         if wandb_url and wandb_url.strip():
             self._ensure_initialized()
-            self._job.update_job_data_field("wandb_run_url", wandb_url.strip())
-            print(f"📊 Captured wandb run URL: {wandb_url.strip()}")
+            self._record_wandb_url(wandb_url.strip(), "Captured wandb run URL")
+
+    def _record_wandb_url(self, wandb_url: str, description: str) -> None:
+        """
+        Store the wandb run URL and note it once in the job log. Storing it
+        stops the per-log/progress detection, so this runs once per URL.
+        """
+        self._set_job_data_field("wandb_run_url", wandb_url)
+        job = self._job
+        assert job is not None
+        job.log_info(f"{description}: {wandb_url}")
 
     # ------------- helpers -------------
-    def _ensure_initialized(self) -> None:
-        if self._experiment is None or self._job is None:
+    def _get_cached_job_data(self) -> Dict[str, Any]:
+        """
+        Return this job's job_data, reading it from storage only on first use.
+        Writes made through this Lab instance keep the cached copy current.
+        """
+        if self._job_data_cache is None:
+            job = self._job
+            assert job is not None
+            job_data = job.get_job_data()
+            self._job_data_cache = job_data if isinstance(job_data, dict) else {}
+        return self._job_data_cache
+
+    def _set_job_data_field(self, key: str, value: Any) -> None:
+        """
+        Write a single job_data field and mirror it into the cache.
+        """
+        self._set_job_data_fields({key: value})
+
+    def _set_job_data_fields(self, updates: Dict[str, Any]) -> None:
+        """
+        Write several job_data fields at once and mirror them into the cache.
+        """
+        job = self._job
+        assert job is not None
+        job.update_job_data_fields(updates)
+        self._get_cached_job_data().update(updates)
+        if "wandb_run_url" in updates:
+            self._wandb_state = 1
+
+    def _append_job_data_list(self, key: str, value: Any, updates: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Append value to a job_data list (plus optional extra fields) and mirror it into the cache.
+        The list is read fresh and written in one read/write of the job file.
+        """
+        self._extend_job_data_list(key, [value], updates=updates)
+
+    def _extend_job_data_list(self, key: str, values: list, updates: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Append several values to a job_data list with one write; see _append_job_data_list.
+        """
+        job = self._job
+        assert job is not None
+        job.extend_job_data_list(key, values, updates=updates)
+        job_data = self._get_cached_job_data()
+        existing = job_data.get(key)
+        if isinstance(existing, list):
+            existing.extend(values)
+        else:
+            job_data[key] = list(values)
+        if updates:
+            job_data.update(updates)
+
+    def _close_background_writers(self) -> None:
+        """
+        Finish all queued provenance writes and stop their threads.
+        """
+        writer = self._provenance_writer
+        if writer is not None:
+            self._provenance_writer = None
+            writer.shutdown(wait=True)
+
+    def _ensure_initialized(self) -> Job:
+        """
+        Raise if init() has not been called; otherwise return the current job
+        so callers can keep it in a local instead of re-reading self._job.
+        """
+        job = self._job
+        if self._experiment is None or job is None:
             raise RuntimeError("lab not initialized. Call lab.init(experiment_id=...) first.")
+        return job
 
     @property
     def job(self) -> Job:
-        self._ensure_initialized()
-        return self._job  # type: ignore[return-value]
+        return self._ensure_initialized()
 
     def get_checkpoints_dir(self) -> str:
         """
         Get the checkpoints directory path for the current job.
         """
-        self._ensure_initialized()
-        return self._job.get_checkpoints_dir()  # type: ignore[union-attr]
+        return self._ensure_initialized().get_checkpoints_dir()
     
     def get_artifacts_dir(self) -> str:
         """
         Get the artifacts directory path for the current job.
         """
-        self._ensure_initialized()
-        return self._job.get_artifacts_dir()  # type: ignore[union-attr]
+        return self._ensure_initialized().get_artifacts_dir()
     
     def get_checkpoint_paths(self) -> list[str]:
         """
         Get list of checkpoint file paths for the current job.
         """
-        self._ensure_initialized()
-        return self._job.get_checkpoint_paths()  # type: ignore[union-attr]
+        return self._ensure_initialized().get_checkpoint_paths()
     
     def get_artifact_paths(self) -> list[str]:
         """
         Get list of artifact file paths for the current job.
         """
-        self._ensure_initialized()
-        return self._job.get_artifact_paths()  # type: ignore[union-attr]
+        return self._ensure_initialized().get_artifact_paths()
+
+    def get_score(self) -> Any:
+        """
+        Get the score recorded by finish(), reading it back from its file if it
+        was too large to keep in job_data. Returns None if no score was set.
+        """
+        score = self._ensure_initialized().get_job_data().get("score")
+        if isinstance(score, dict) and "$ref" in score:
+            with storage.open(score["$ref"], "rb") as f:
+                return json.loads(f.read())
+        return score
 
     @property
     def experiment(self) -> Experiment:
@@ -904,6 +1041,163 @@ class Lab:
 
 
 
+def _resolve_source(source_path: Any, kind: str, context: str = "") -> tuple[str, str]:
+    """
+    Validate and resolve the source of a save_* call.
+    Returns (path, path_type), path_type being "file" or "directory", from a
+    single stat; kind names the source in the FileNotFoundError message.
+    """
+    if isinstance(source_path, os.PathLike):
+        source_path = os.fspath(source_path)
+    if not isinstance(source_path, str) or source_path.strip() == "":
+        raise ValueError(f"source_path must be a non-empty string {context}".rstrip())
+    src = _resolve_source_path(source_path)
+    src_type = storage.path_type(src)
+    if src_type is None:
+        raise FileNotFoundError(f"{kind} source does not exist: {src}")
+    return src, src_type
+
+
+def _copy_source(src: str, src_type: str, dest: str, overwrite: str) -> None:
+    """
+    Copy a resolved save_* source to dest. Nothing is copied when src already
+    is dest (e.g. a file saved from inside the job's own directories), which
+    also keeps "replace" from deleting the source.
+    """
+    dest_exists = True
+    if "://" not in src and storage.is_local(dest):
+        try:
+            if os.path.samefile(src, dest):
+                return
+        except FileNotFoundError:
+            # The usual case (a new name): nothing to replace
+            dest_exists = False
+        except OSError:
+            pass
+    if src_type == "directory":
+        if overwrite == "replace" and dest_exists:
+            storage.rm_tree(dest)
+        storage.copy_dir(src, dest)
+    else:
+        storage.copy_file(src, dest)
+
+
+def _resolve_source_path(source_path: str) -> str:
+    """
+    Make a local source path absolute; remote paths (s3://, etc.) are used as-is.
+    Absolute paths are only normalized, which avoids the getcwd() in os.path.abspath.
+    """
+    if source_path.startswith(("s3://", "gs://", "abfs://", "gcs://", "http://", "https://")):
+        return source_path
+    if os.path.isabs(source_path):
+        return os.path.normpath(source_path)
+    return os.path.abspath(source_path)
+
+
+def _is_pyarrow_table(data: Any) -> bool:
+    return type(data).__module__.startswith("pyarrow") and hasattr(data, "schema") and hasattr(data, "num_rows")
+
+
+def _is_hf_dataset(data: Any) -> bool:
+    # datasets.Dataset: Arrow-backed, with features and its own to_parquet
+    return hasattr(data, "features") and hasattr(data, "to_parquet") and hasattr(data, "to_pandas")
+
+
+def _is_arrow_backed(data: Any) -> bool:
+    return _is_pyarrow_table(data) or _is_hf_dataset(data)
+
+
+def _check_overwrite_mode(overwrite: str) -> None:
+    if overwrite not in ("replace", "merge"):
+        raise ValueError(f"overwrite must be 'replace' or 'merge', got {overwrite!r}")
+
+
+# The wandb module, once the running script has imported it
+_wandb = None
+
+
+def _write_model_provenance(
+    job: Job,
+    model_service: ModelService,
+    dest: str,
+    base_name: str,
+    architecture: Optional[str],
+    provenance_metadata: Dict[str, Any],
+) -> None:
+    """
+    Checksum a saved model and write its _tlab_provenance.json.
+    Runs on a background thread; it logs through the job directly, as
+    Job.log_info is thread-safe.
+    """
+    try:
+        # Create MD5 checksums for all model files
+        md5_objects = model_service.create_md5_checksums(dest)
+        provenance_metadata = {
+            **provenance_metadata,
+            "end_time": time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime()),
+            "md5_checksums": md5_objects,
+        }
+        
+        # Create the _tlab_provenance.json file
+        provenance_file = model_service.create_provenance_file(
+            model_path=dest,
+            model_name=base_name,
+            model_architecture=architecture,
+            md5_objects=md5_objects,
+            provenance_data=provenance_metadata
+        )
+        job.log_info(f"Provenance file created at: {provenance_file}")
+    except Exception as e:
+        job.log_info(f"Warning: Model saved but provenance creation failed: {str(e)}")
+
+
+def _get_wandb_module():
+    """
+    Return the wandb module if the running script has already imported it.
+    wandb is never imported here: a process with an active wandb run has
+    imported it already, and importing it otherwise costs hundreds of ms.
+    Once seen, the module is kept so later calls skip the sys.modules lookup.
+    """
+    global _wandb
+    if _wandb is None:
+        _wandb = sys.modules.get("wandb")
+    return _wandb
+
+
+def _url_from_env() -> str | None:
+    return os.environ.get('WANDB_URL') or None
+
+
+def _url_from_run() -> str | None:
+    wandb = _get_wandb_module()
+    run = getattr(wandb, "run", None) if wandb is not None else None
+    return getattr(run, "url", None) if run is not None else None
+
+
+def _probe_wandb_url(check_env: bool = True, check_run: bool = True, prefer_run: bool = False) -> str | None:
+    """
+    Look for a wandb run URL in the WANDB_URL environment variable and on the
+    active wandb run, in that order (or run first when prefer_run is set).
+    This is the single lookup shared by Lab and the capture_wandb_url_from_* helpers.
+
+    Returns:
+        str: The wandb run URL if found, None otherwise
+    """
+    sources = []
+    if check_env:
+        sources.append(_url_from_env)
+    if check_run:
+        if prefer_run:
+            sources.insert(0, _url_from_run)
+        else:
+            sources.append(_url_from_run)
+    for source in sources:
+        wandb_url = source()
+        if wandb_url:
+            return wandb_url
+    return None
+
+
 def capture_wandb_url_from_env() -> str | None:
     """
     Utility function to capture wandb run URL from environment variables.
@@ -912,7 +1206,7 @@ def capture_wandb_url_from_env() -> str | None:
     Returns:
         str: The wandb run URL if found, None otherwise
     """
-    return os.environ.get('WANDB_URL')
+    return _probe_wandb_url(check_run=False)
 
 
 def capture_wandb_url_from_run() -> str | None:
@@ -923,13 +1217,7 @@ def capture_wandb_url_from_run() -> str | None:
     Returns:
         str: The wandb run URL if found, None otherwise
     """
-    try:
-        import wandb
-        if wandb.run is not None and hasattr(wandb.run, 'url'):
-            return wandb.run.url
-    except ImportError:
-        pass
-    return None
+    return _probe_wandb_url(check_env=False)
 
 
 def capture_wandb_url_from_trl() -> str | None:
@@ -940,15 +1228,5 @@ def capture_wandb_url_from_trl() -> str | None:
     Returns:
         str: The wandb run URL if found, None otherwise
     """
-    try:
-        import wandb
-        # Check for wandb in TRL trainer context
-        if wandb.run is not None:
-            return wandb.run.url
-        
-        # Check environment variables as fallback
-        return os.environ.get('WANDB_URL')
-    except ImportError:
-        return None
-
-
+    # Prefer the active run, falling back to environment variables
+    return _probe_wandb_url(prefer_run=True)
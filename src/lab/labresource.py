@@ -1,8 +1,21 @@
 from abc import ABC, abstractmethod
 import json
+import os
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from . import storage
 
+try:
+    # Optional: C JSON parser for the frequently read index.json
+    import orjson
+except ImportError:
+    orjson = None
+
+# Resource directories known to hold a single index.json and no timestamped
+# index files, so _migrate_to_single_index can skip listing them again
+_migrated_dirs: set[str] = set()
+
 
 class BaseLabResource(ABC):
     """
@@ -12,6 +25,23 @@ class BaseLabResource(ABC):
     Lab resources have an associated directory and a json file with metadata.
     """
 
+    # ((inode, mtime, size), contents) of the last local index.json read or
+    # written by this instance, replaced in one assignment so a concurrent
+    # reader never pairs one file's key with another's contents
+    _json_cache = None
+
+    # JSON data held in memory by buffered(), and the thread that owns it
+    _buffer = None
+    _buffer_owner = None
+    _dirty = False
+
+    # Set once this instance has checked its directory for legacy index files
+    _migration_checked = False
+
+    # Memoized resource directory (set by subclasses' get_dir) and index.json path
+    _dir = None
+    _json_file = None
+
     def __init__(self, id):
         self.id = id
 
@@ -37,15 +67,17 @@ class BaseLabResource(ABC):
         If the entity's metadata file does not exist then create a default.
         """
         newobj = cls(id)
-        resource_dir = newobj.get_dir()
-        if not storage.isdir(resource_dir):
+        json_file = newobj._get_json_file()
+        # Common case: an existing metadata file implies the directory exists too
+        if storage.isfile(json_file):
+            newobj._ensure_migrated()
+            return newobj
+        if not storage.isdir(newobj.get_dir()):
             raise FileNotFoundError(
                 f"Directory for {cls.__name__} with id '{id}' not found"
             )
-        json_file = newobj._get_json_file()
-        if not storage.exists(json_file):
-            with storage.open(json_file, "w", encoding="utf-8") as f:
-                json.dump(newobj._default_json(), f)
+        newobj._write_json_file(_dumps(newobj._default_json()))
+        newobj._ensure_migrated()
         return newobj
 
     ###
@@ -70,8 +102,8 @@ class BaseLabResource(ABC):
             raise FileExistsError(
                 f"{type(self).__name__} with id '{self.id}' already exists"
             )
-        with storage.open(json_file, "w", encoding="utf-8") as f:
-            json.dump(self._default_json(), f)
+        self._write_json_file(_dumps(self._default_json()))
+        self._ensure_migrated()
 
     def _default_json(self):
         """Override in subclasses to support the initialize method."""
@@ -79,7 +111,9 @@ class BaseLabResource(ABC):
 
     def _get_json_file(self):
         """Get json file containing metadata for this resource."""
-        return storage.join(self.get_dir(), "index.json")
+        if self._json_file is None:
+            self._json_file = storage.join(self.get_dir(), "index.json")
+        return self._json_file
 
 
     def get_json_data(self):
@@ -87,25 +121,47 @@ class BaseLabResource(ABC):
         Return the JSON data that is stored for this resource in the filesystem.
         If the file doesn't exist then return an empty dict.
         """
-        # Migrate from timestamped files to single index.json if needed
-        self._migrate_to_single_index()
+        if self._is_buffering():
+            return self._buffer
+
+        # Migrate from timestamped files to single index.json if needed.
+        # Usually already done when the object was created by get()/create().
+        self._ensure_migrated()
         
         json_file = self._get_json_file()
 
         # Try opening this file location and parsing the json inside
         # On any error return an empty dict
         try:
-            with storage.open(json_file, "r", encoding="utf-8") as f:
-                content = f.read()
-                # Clean the content - remove trailing whitespace and extra characters
-                content = content.strip()
-                # Remove any trailing % characters (common in some shell outputs)
-                content = content.rstrip('%')
-                content = content.strip()
-                return json.loads(content)
+            # Local files are only re-read when their stat changes; the bytes
+            # are still parsed on every call so callers get their own dict
+            key = _stat_key(json_file) if storage.is_local(json_file) else None
+            cache = self._json_cache
+            if key is not None and cache is not None and cache[0] == key:
+                content = cache[1]
+            else:
+                # Local files skip fsspec's file wrapper and are read in one call
+                opener = open if key is not None else storage.open
+                with opener(json_file, "rb") as f:
+                    content = _clean_json_bytes(f.read())
+                self._json_cache = (key, content) if key is not None else None
+            return _loads(content)
         except (FileNotFoundError, json.JSONDecodeError):
             return {}
 
+    @staticmethod
+    def _json_from_bytes(content: bytes | None) -> dict:
+        """
+        Parse index.json contents that were read elsewhere (e.g. fetched in a
+        batch), the same way get_json_data does. None means the file is missing.
+        """
+        if content is None:
+            return {}
+        try:
+            return _loads(_clean_json_bytes(content))
+        except json.JSONDecodeError:
+            return {}
+
     def _set_json_data(self, json_data):
         """
         Sets the entire JSON data that is stored for this resource in the filesystem.
@@ -118,13 +174,47 @@ class BaseLabResource(ABC):
         if not isinstance(json_data, dict):
             raise TypeError("json_data must be a dict")
 
-        # Migrate from timestamped files to single index.json if needed
-        self._migrate_to_single_index()
+        if self._is_buffering():
+            self._buffer = json_data
+            self._dirty = True
+            return
+
+        self._set_json_data_bytes(_dumps(json_data))
+
+    def _set_json_data_bytes(self, data: bytes):
+        """Write already-serialized JSON as this resource's index.json."""
+        # Migrate from timestamped files to single index.json if needed.
+        # Usually already done when the object was created by get()/create().
+        self._ensure_migrated()
+        self._write_json_file(data)
+
+    def _write_json_file(self, data: bytes):
+        """
+        Replace index.json with data.
 
-        # Write directly to index.json
+        Local files are written to a temporary file and renamed over index.json,
+        so concurrent readers never see a partially written file and a crash
+        mid-write leaves the previous contents. Remote stores replace objects
+        whole on upload, so those are written directly.
+        """
         json_file = self._get_json_file()
-        with storage.open(json_file, "w", encoding="utf-8") as f:
-            json.dump(json_data, f, ensure_ascii=False)
+        if storage.is_local(json_file):
+            tmp_file = f"{json_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                _write_local_file(tmp_file, data)
+                os.replace(tmp_file, json_file)
+                self._json_cache = (_stat_key(json_file), data)
+                return
+            except OSError:
+                # e.g. renames not permitted on this mount; write in place instead
+                try:
+                    os.remove(tmp_file)
+                except OSError:
+                    pass
+
+        self._json_cache = None
+        with storage.open(json_file, "wb") as f:
+            f.write(data)
 
     def _get_json_data_field(self, key, default=""):
         """Gets the value of a single top-level field in a JSON object"""
@@ -137,102 +227,215 @@ class BaseLabResource(ABC):
         json_data[key] = value
         self._set_json_data(json_data)
 
+    def update_fields(self, **fields):
+        """
+        Set several top-level fields in the JSON object with one read and one write.
+        """
+        json_data = self.get_json_data()
+        json_data.update(fields)
+        self._set_json_data(json_data)
+
+    @contextmanager
+    def buffered(self):
+        """
+        Context manager that batches metadata updates made in this thread.
+        The JSON data is read once on entry, reads and writes inside the block
+        use that in-memory copy, and it is written back once on exit if anything
+        changed. Nothing is written if the block raises.
+        """
+        if self._is_buffering():
+            # Nested: the outermost block writes
+            yield self
+            return
+        self._buffer = self.get_json_data()
+        self._buffer_owner = threading.get_ident()
+        self._dirty = False
+        try:
+            yield self
+            json_data, dirty = self._buffer, self._dirty
+        finally:
+            self._buffer = None
+            self._buffer_owner = None
+            self._dirty = False
+        if dirty:
+            self._set_json_data(json_data)
+
+    def _is_buffering(self) -> bool:
+        return (
+            self._buffer_owner is not None
+            and self._buffer_owner == threading.get_ident()
+        )
+
+    def _ensure_migrated(self):
+        """Run _migrate_to_single_index once for this instance."""
+        if not self._migration_checked:
+            self._migrate_to_single_index()
+            self._migration_checked = True
+
     def _migrate_to_single_index(self):
         """
         Migrate from timestamped index files to a single index.json file.
         This method is idempotent and safe to call multiple times.
         """
         resource_dir = self.get_dir()
+        if resource_dir in _migrated_dirs:
+            return
         if not storage.exists(resource_dir):
             return
 
+        # One listing finds the timestamped files to migrate and clean up
+        timestamped_files = _list_timestamped_index_files(resource_dir)
+
         # Check if we already have a single index.json file
         index_file = self._get_json_file()
-        if storage.exists(index_file):
-            # Check if there are any timestamped files to migrate
-            has_timestamped_files = False
-            try:
-                entries = storage.ls(resource_dir, detail=False)
-            except Exception:
-                entries = []
-            for entry in entries:
-                filename = entry.rstrip("/").split("/")[-1]
-                if filename.startswith("index-") and filename.endswith(".json"):
-                    has_timestamped_files = True
-                    break
-            
-            if not has_timestamped_files:
-                return  # Already migrated
+        if not timestamped_files and storage.exists(index_file):
+            _migrated_dirs.add(resource_dir)
+            return  # Already migrated
 
         # Find the most recent timestamped file
         latest_file = None
-        latest_timestamp = None
         
         # First, try to use latest.txt if it exists
         latest_txt_path = storage.join(resource_dir, "latest.txt")
-        if storage.exists(latest_txt_path):
-            try:
-                with storage.open(latest_txt_path, "r", encoding="utf-8") as lf:
-                    latest_filename = lf.read().strip()
-                    if latest_filename:
-                        candidate_path = storage.join(resource_dir, latest_filename)
-                        if storage.isfile(candidate_path):
-                            latest_file = candidate_path
-            except Exception:
-                pass
-
-        # If no latest.txt or file doesn't exist, find the most recent by timestamp
+        try:
+            latest_filename = _read_small_file(latest_txt_path).decode("utf-8").strip()
+            if latest_filename:
+                candidate_path = storage.join(resource_dir, latest_filename)
+                if storage.isfile(candidate_path):
+                    latest_file = candidate_path
+        except (OSError, UnicodeDecodeError):
+            # Missing or unreadable latest.txt
+            pass
+
+        # If no latest.txt or file doesn't exist, find the most recent by timestamp.
+        # The timestamps are fixed width, so names sort chronologically and
+        # only the newest one with a valid timestamp needs to be parsed.
         if not latest_file:
-            try:
-                entries = storage.ls(resource_dir, detail=False)
-            except Exception:
-                entries = []
-            for entry in entries:
-                filename = entry.rstrip("/").split("/")[-1]
-                if filename.startswith("index-") and filename.endswith(".json"):
-                    try:
-                        # Extract timestamp from filename
-                        timestamp_str = filename[6:-5]  # Remove "index-" and ".json"
-                        timestamp = datetime.strptime(timestamp_str, "%Y%m%dT%H%M%S%fZ")
-                        if latest_timestamp is None or timestamp > latest_timestamp:
-                            latest_timestamp = timestamp
-                            latest_file = storage.join(resource_dir, filename)
-                    except ValueError:
-                        # Skip files with invalid timestamp format
-                        continue
-
-        # If we found a latest file, migrate it to index.json
-        if latest_file and storage.exists(latest_file):
-            try:
-                with storage.open(latest_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                
-                # Write to index.json
-                with storage.open(index_file, "w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False)
-                
-                # Clean up timestamped files and latest.txt
+            for filename in sorted(timestamped_files, reverse=True):
                 try:
-                    entries = storage.ls(resource_dir, detail=False)
-                except Exception:
-                    entries = []
-                for entry in entries:
-                    filename = entry.rstrip("/").split("/")[-1]
-                    if filename.startswith("index-") and filename.endswith(".json"):
-                        storage.rm(storage.join(resource_dir, filename))
-                
-                if storage.exists(latest_txt_path):
-                    storage.rm(latest_txt_path)
-                    
-            except Exception:
-                # If migration fails, leave everything as is
-                pass
+                    # Extract timestamp from filename
+                    timestamp_str = filename[6:-5]  # Remove "index-" and ".json"
+                    datetime.strptime(timestamp_str, "%Y%m%dT%H%M%S%fZ")
+                except ValueError:
+                    # Skip files with invalid timestamp format
+                    continue
+                latest_file = storage.join(resource_dir, filename)
+                break
+
+        if not latest_file:
+            return
+
+        # Migrate the latest file to index.json. If it can't be read or parsed,
+        # leave everything as is.
+        try:
+            data = _loads(_read_small_file(latest_file))
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict):
+            return
+        try:
+            self._write_json_file(_dumps(data))
+
+            # Clean up timestamped files and latest.txt
+            for filename in timestamped_files:
+                storage.rm(storage.join(resource_dir, filename))
+            storage.rm(latest_txt_path)
+        except OSError:
+            # Leftover files are retried on the next check
+            return
+        _migrated_dirs.add(resource_dir)
 
     def delete(self):
         """
         Delete this resource by deleting the containing directory.
         TODO: We should change to soft delete
         """
+        self._json_cache = None
+        self._migration_checked = False
         resource_dir = self.get_dir()
+        _migrated_dirs.discard(resource_dir)
         if storage.exists(resource_dir):
             storage.rm_tree(resource_dir)
+
+
+def _list_timestamped_index_files(resource_dir: str) -> list[str]:
+    """Return the names of the legacy index-<timestamp>.json files in resource_dir."""
+    try:
+        if storage.is_local(resource_dir):
+            with os.scandir(resource_dir) as it:
+                names = [entry.name for entry in it]
+        else:
+            names = [
+                entry.rstrip("/").split("/")[-1]
+                for entry in storage.ls(resource_dir, detail=False)
+            ]
+    except Exception:
+        return []
+    return [
+        name for name in names
+        if name.startswith("index-") and name.endswith(".json")
+    ]
+
+
+def _read_small_file(path: str) -> bytes:
+    """Read a small file whole; local files with a single os.read call."""
+    if storage.is_local(path):
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            return os.read(fd, os.fstat(fd).st_size + 1)
+        finally:
+            os.close(fd)
+    with storage.open(path, "rb") as f:
+        return f.read()
+
+
+def _clean_json_bytes(content: bytes) -> bytes:
+    # Clean the content - remove trailing whitespace and extra characters
+    content = content.strip()
+    # Remove any trailing % characters (common in some shell outputs)
+    content = content.rstrip(b'%')
+    return content.strip()
+
+
+def _stat_key(path: str) -> tuple[int, int, int]:
+    """
+    Identify the current version of a local file. Writes through this class
+    replace the file, which also changes the inode.
+    """
+    st = os.stat(path)
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _write_local_file(path: str, data: bytes) -> None:
+    """Write data to a local file with unbuffered os.write calls (usually one)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _loads(content: bytes):
+    """
+    Parse JSON bytes, with orjson when it is installed. Documents orjson
+    rejects (e.g. NaN/Infinity written by the stdlib encoder) fall back to
+    the stdlib parser.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+def _dumps(json_data: dict) -> bytes:
+    """
+    Serialize json_data to UTF-8 bytes with the stdlib encoder. orjson is not
+    used here: it writes NaN/Infinity as null and accepts values (e.g.
+    datetimes) the stdlib rejects, so output would depend on whether the
+    optional dependency is installed.
+    """
+    return json.dumps(json_data, ensure_ascii=False).encode("utf-8")
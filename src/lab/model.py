@@ -1,4 +1,6 @@
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from werkzeug.utils import secure_filename
 import time
 
@@ -7,11 +9,18 @@ from .labresource import BaseLabResource
 from . import storage
 
 
+# Read size and worker count for create_md5_checksums
+_MD5_CHUNK_SIZE = 1024 * 1024
+_MD5_WORKERS = min(32, os.cpu_count() or 1)
+
+
 class Model(BaseLabResource):
     def get_dir(self):
         """Abstract method on BaseLabResource"""
-        model_id_safe = secure_filename(str(self.id))
-        return storage.join(get_models_dir(), model_id_safe)
+        if self._dir is None:
+            model_id_safe = secure_filename(str(self.id))
+            self._dir = storage.join(get_models_dir(), model_id_safe)
+        return self._dir
 
     def _default_json(self):
         # Default metadata modeled after API model table fields
@@ -86,8 +95,8 @@ class Model(BaseLabResource):
             config_path = storage.join(model_path, "config.json")
             if storage.exists(config_path):
                 try:
-                    with storage.open(config_path, 'r') as f:
-                        config = json.load(f)
+                    with storage.open(config_path, "rb") as f:
+                        config = json.loads(f.read())
                         architectures = config.get("architectures", [])
                         if architectures:
                             architecture = architectures[0]
@@ -118,6 +127,7 @@ class Model(BaseLabResource):
     def create_md5_checksums(self, model_path: str) -> list:
         """
         Create MD5 checksums for all files in the model directory.
+        Files are hashed in parallel (hashlib releases the GIL while hashing).
         
         Args:
             model_path: Path to the model directory
@@ -128,12 +138,30 @@ class Model(BaseLabResource):
         import hashlib
         
         def compute_md5(file_path):
-            md5 = hashlib.md5()
             with storage.open(file_path, "rb") as f:
-                while chunk := f.read(8192):
+                if hasattr(hashlib, "file_digest"):
+                    # Python 3.11+: read and hash in one C loop
+                    return hashlib.file_digest(f, "md5").hexdigest()
+                md5 = hashlib.md5()
+                while chunk := f.read(_MD5_CHUNK_SIZE):
                     md5.update(chunk)
             return md5.hexdigest()
 
+        def try_compute_md5(file_path):
+            try:
+                return {"file_path": file_path, "md5_hash": compute_md5(file_path)}
+            except Exception as e:
+                print(f"Warning: Could not compute MD5 for {file_path}: {str(e)}")
+                return None
+
+        def compute_all(file_paths):
+            if len(file_paths) <= 1:
+                results = [try_compute_md5(p) for p in file_paths]
+            else:
+                with ThreadPoolExecutor(max_workers=min(_MD5_WORKERS, len(file_paths))) as pool:
+                    results = list(pool.map(try_compute_md5, file_paths))
+            return [r for r in results if r is not None]
+
         md5_objects = []
 
         if not storage.isdir(model_path):
@@ -143,23 +171,15 @@ class Model(BaseLabResource):
         # Use fsspec's walk equivalent for directory traversal
         try:
             files = storage.find(model_path)
-            for file_path in files:
-                try:
-                    md5_hash = compute_md5(file_path)
-                    md5_objects.append({"file_path": file_path, "md5_hash": md5_hash})
-                except Exception as e:
-                    print(f"Warning: Could not compute MD5 for {file_path}: {str(e)}")
         except Exception:
+            files = None
+        if files is not None:
+            md5_objects = compute_all(files)
+        else:
             # Fallback: if find doesn't work, try listing the directory
             try:
                 entries = storage.ls(model_path, detail=False)
-                for entry in entries:
-                    if storage.isfile(entry):
-                        try:
-                            md5_hash = compute_md5(entry)
-                            md5_objects.append({"file_path": entry, "md5_hash": md5_hash})
-                        except Exception as e:
-                            print(f"Warning: Could not compute MD5 for {entry}: {str(e)}")
+                md5_objects = compute_all([entry for entry in entries if storage.isfile(entry)])
             except Exception:
                 pass
 
@@ -207,8 +227,8 @@ class Model(BaseLabResource):
 
         # Write provenance to file
         provenance_path = storage.join(model_path, "_tlab_provenance.json")
-        with storage.open(provenance_path, "w") as f:
-            json.dump(final_provenance, f, indent=2)
+        with storage.open(provenance_path, "wb") as f:
+            f.write(json.dumps(final_provenance, indent=2).encode("utf-8"))
 
         return provenance_path
 
@@ -249,7 +269,7 @@ class Model(BaseLabResource):
         model_description["json_data"].update(json_data)
 
         # Output the json to the file
-        with storage.open(storage.join(self.get_dir(), "index.json"), "w") as outfile:
-            json.dump(model_description, outfile)
+        with storage.open(storage.join(self.get_dir(), "index.json"), "wb") as outfile:
+            outfile.write(json.dumps(model_description).encode("utf-8"))
 
         return model_description
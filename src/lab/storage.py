@@ -1,8 +1,16 @@
+import builtins
 import os
 import posixpath
+import shutil
+import stat
+import time
 import contextvars
+import functools
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 
 import fsspec
+from fsspec.asyn import AsyncFileSystem
+from fsspec.implementations.local import LocalFileSystem
 
 
 # Context variable for storage URI (set by host app/session)
@@ -12,6 +20,9 @@ _current_tfl_storage_uri: contextvars.ContextVar[str | None] = contextvars.Conte
 
 _AWS_PROFILE = os.getenv("AWS_PROFILE")
 
+# Object store URIs whose listings come back without the protocol
+_REMOTE_URI_PREFIXES = ("s3://", "gs://", "abfs://", "gcs://")
+
 
 def _get_fs_and_root():
     """
@@ -22,19 +33,38 @@ def _get_fs_and_root():
     tfl_uri = _current_tfl_storage_uri.get() or os.getenv("TFL_STORAGE_URI")
     
     if not tfl_uri or tfl_uri.strip() == "":
-        root = os.getenv(
-            "TFL_HOME_DIR",
-            os.path.join(os.path.expanduser("~"), ".transformerlab"),
-        )
-        fs = fsspec.filesystem("file")
-        return fs, root
+        root = os.getenv("TFL_HOME_DIR")
+        if root is None:
+            root = _default_home_dir()
+        return _local_fs(), root
+
+    return _remote_fs_and_root(tfl_uri)
+
+
+@functools.lru_cache(maxsize=1)
+def _default_home_dir() -> str:
+    # The user's home directory is fixed for the life of the process
+    return os.path.join(os.path.expanduser("~"), ".transformerlab")
+
+
+@functools.lru_cache(maxsize=1)
+def _local_fs():
+    return fsspec.filesystem("file")
 
+
+@functools.lru_cache(maxsize=8)
+def _remote_fs_and_root(tfl_uri: str):
+    """
+    Parse a storage URI into (filesystem, root). Cached per URI so that the
+    many storage calls made per operation don't re-parse it and rebuild
+    credential providers each time.
+    """
     # Let fsspec parse the URI
     fs, _token, paths = fsspec.get_fs_token_paths(
         tfl_uri, storage_options={"profile": _AWS_PROFILE} if _AWS_PROFILE else None
     )
     # For S3 and other remote filesystems, we need to maintain the full URI format
-    if tfl_uri.startswith(("s3://", "gs://", "abfs://", "gcs://")):
+    if tfl_uri.startswith(_REMOTE_URI_PREFIXES):
         root = tfl_uri.rstrip("/")
     else:
         root = paths[0] if paths else ""
@@ -73,32 +103,115 @@ def root_join(*parts: str) -> str:
     return join(root_uri(), *parts)
 
 
+# Remote exists/isdir/isfile answers are each a network round trip. Positive
+# answers are cached briefly, keyed by the active storage root as well as the
+# path so switching TFL_STORAGE_URI/organization never reuses another store's
+# answers. rm/rm_tree, makedirs and copies into remote paths drop the cache;
+# changes made by other processes are seen once the TTL runs out.
+# Negative answers are not cached, since a file being written appears on close.
+_STAT_CACHE_TTL = 2.0
+_STAT_CACHE_MAX = 4096
+_stat_cache: dict[tuple[str, str, str], float] = {}
+
+
+def _cached_check(kind: str, path: str) -> bool:
+    """Answer fs.exists/isdir/isfile (named by kind) for path, caching positives."""
+    fs, root = _get_fs_and_root()
+    key = (kind, root, path)
+    now = time.monotonic()
+    checked_at = _stat_cache.get(key)
+    if checked_at is not None and now - checked_at < _STAT_CACHE_TTL:
+        return True
+    result = getattr(fs, kind)(path)
+    if result:
+        if len(_stat_cache) >= _STAT_CACHE_MAX:
+            _stat_cache.clear()
+        _stat_cache[key] = now
+    return result
+
+
+def _invalidate_stat_cache() -> None:
+    _stat_cache.clear()
+
+
 def exists(path: str) -> bool:
-    return filesystem().exists(path)
+    if is_local(path):
+        return os.path.exists(path)
+    return _cached_check("exists", path)
+
+
+def path_type(path: str) -> str | None:
+    """
+    Return "directory" or "file" for an existing path, or None if it does not exist.
+    Answers exists() and isdir() with a single stat/info call.
+    """
+    if is_local(path):
+        try:
+            st = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        return "directory" if stat.S_ISDIR(st.st_mode) else "file"
+    try:
+        info = filesystem().info(path)
+    except FileNotFoundError:
+        return None
+    return "directory" if info.get("type") == "directory" else "file"
 
 
 def isdir(path: str, fs=None) -> bool:
     try:
-        filesys = fs if fs is not None else filesystem()
-        return filesys.isdir(path)
+        if fs is not None:
+            return fs.isdir(path)
+        if is_local(path):
+            return os.path.isdir(path)
+        return _cached_check("isdir", path)
     except Exception:
         return False
 
 
 def isfile(path: str) -> bool:
     try:
-        return filesystem().isfile(path)
+        if is_local(path):
+            return os.path.isfile(path)
+        return _cached_check("isfile", path)
     except Exception:
         return False
 
 
+def is_local(path: str) -> bool:
+    """Return True if path is a plain path on the local filesystem."""
+    return "://" not in path and isinstance(filesystem(), LocalFileSystem)
+
+
+def _ensure_dir(path: str) -> None:
+    """
+    Create a local directory, assuming the parent usually exists already.
+    A single mkdir is tried first; missing parents fall back to os.makedirs.
+    """
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        # Only an existing directory satisfies the request, not a file
+        if not os.path.isdir(path):
+            raise
+    except FileNotFoundError:
+        os.makedirs(path, exist_ok=True)
+
+
 def makedirs(path: str, exist_ok: bool = True) -> None:
+    # Fast path for local paths: most calls create a single level (e.g. a new job dir)
+    if exist_ok and is_local(path):
+        _ensure_dir(path)
+        return
+    fs = filesystem()
     try:
-        filesystem().makedirs(path, exist_ok=exist_ok)
+        fs.makedirs(path, exist_ok=exist_ok)
     except TypeError:
         # Some filesystems don't support exist_ok parameter
         if not exist_ok or not exists(path):
-            filesystem().makedirs(path)
+            fs.makedirs(path)
+    finally:
+        _invalidate_stat_cache()
 
 
 def ls(path: str, detail: bool = False, fs=None):
@@ -108,22 +221,39 @@ def ls(path: str, detail: bool = False, fs=None):
     paths = filesys.ls(path, detail=detail)
     # Dont include the current path in the list
     # Ensure paths are full URIs for remote filesystems
-    if path.startswith(("s3://", "gs://", "abfs://", "gcs://")):
+    if path.startswith(_REMOTE_URI_PREFIXES):
         # For remote filesystems, ensure returned paths are full URIs
-        full_paths = []
-        for p in paths:
-            if not p.startswith(("s3://", "gs://", "abfs://", "gcs://")):
-                # Convert relative path to full URI
-                protocol = path.split("://")[0] + "://"
-                full_path = protocol + p
-                full_paths.append(full_path)
-            else:
-                full_paths.append(p)
-        full_paths = [p for p in full_paths if p != path]
-        return full_paths
+        # (converting bucket-relative paths with the listed path's protocol)
+        protocol = path.split("://", 1)[0] + "://"
+        full_paths = (
+            p if p.startswith(_REMOTE_URI_PREFIXES) else protocol + p for p in paths
+        )
+        return [p for p in full_paths if p != path]
     return paths
 
 
+def cat_files(paths: list[str]) -> list[bytes | None]:
+    """
+    Read several whole files, returning their contents in the order given
+    (None for files that don't exist). Async stores such as s3fs fetch them
+    concurrently in one call instead of one request after another.
+    """
+    if not paths:
+        return []
+    if is_local(paths[0]):
+        contents = []
+        for path in paths:
+            try:
+                with builtins.open(path, "rb") as f:
+                    contents.append(f.read())
+            except FileNotFoundError:
+                contents.append(None)
+        return contents
+    fs = filesystem()
+    found = fs.cat(list(paths), on_error="omit")
+    return [found.get(fs._strip_protocol(path)) for path in paths]
+
+
 def find(path: str) -> list[str]:
     return filesystem().find(path)
 
@@ -144,21 +274,54 @@ def walk(path: str, maxdepth=None, topdown=True, on_error='omit'):
     return filesystem().walk(path, maxdepth=maxdepth, topdown=topdown, on_error=on_error)
 
 
+# Paths passed to one fs.rm() call by rm_tree's fallback
+_RM_BATCH = 1000
+
+
 def rm(path: str) -> None:
-    if exists(path):
+    if is_local(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        return
+    # Delete directly rather than checking exists() first: one request, not two
+    try:
         filesystem().rm(path)
+    except FileNotFoundError:
+        pass
+    finally:
+        _invalidate_stat_cache()
 
 
 def rm_tree(path: str) -> None:
-    if exists(path):
+    if is_local(path):
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path)
+        elif os.path.lexists(path):
+            os.remove(path)
+        return
+    # Delete directly rather than checking exists() first
+    fs = filesystem()
+    try:
+        fs.rm(path, recursive=True)
+    except FileNotFoundError:
+        pass
+    except TypeError:
+        # Some filesystems don't support recursive parameter
+        # Use find() to get all files and remove them in batches
+        # (stores like S3 delete up to 1000 keys per request)
+        files = list(reversed(fs.find(path)))  # Remove files before directories
         try:
-            filesystem().rm(path, recursive=True)
+            for i in range(0, len(files), _RM_BATCH):
+                fs.rm(files[i:i + _RM_BATCH])
         except TypeError:
-            # Some filesystems don't support recursive parameter
-            # Use find() to get all files and remove them individually
-            files = find(path)
-            for file_path in reversed(files):  # Remove files before directories
-                filesystem().rm(file_path)
+            # No list support either: one path at a time
+            for file_path in files:
+                if fs.exists(file_path):
+                    fs.rm(file_path)
+    finally:
+        _invalidate_stat_cache()
 
 
 def open(path: str, mode: str = "r", fs=None, **kwargs):
@@ -166,16 +329,234 @@ def open(path: str, mode: str = "r", fs=None, **kwargs):
     return filesys.open(path, mode=mode, **kwargs)
 
 
+# ioctl request number for FICLONE from linux/fs.h
+_FICLONE = 0x40049409
+
+# Bytes per copy_file_range/sendfile call, and buffer size for the userspace fallback
+_KERNEL_COPY_CHUNK = 1024 * 1024 * 1024
+_COPY_BUFSIZE = 4 * 1024 * 1024
+
+
+def _stream_chunk_size() -> int:
+    """
+    Buffer size for streaming copies that involve a remote filesystem, from
+    TFL_COPY_CHUNK_MB (default 8), read on each copy. The default is moderate
+    because copy_dir runs up to _copy_workers() of these at once; S3 needs
+    parts of 5 MiB or more.
+    """
+    try:
+        mb = int(os.getenv("TFL_COPY_CHUNK_MB", "8"))
+    except ValueError:
+        mb = 8
+    return max(5, mb) * 1024 * 1024
+
+
+def _copy_workers() -> int:
+    """
+    Worker threads for copying the files of a directory tree, from
+    TFL_COPY_PARALLELISM, read on each copy.
+    """
+    try:
+        workers = int(os.getenv("TFL_COPY_PARALLELISM", ""))
+    except ValueError:
+        return min(32, (os.cpu_count() or 1) * 4)
+    return max(1, workers)
+
+
+def _copy_pairs(copy, pairs, max_workers: int) -> None:
+    """
+    Run copy(src, dest) for each pair on a thread pool. The first failure
+    cancels the copies that have not started yet and is raised.
+    """
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pairs))) as pool:
+        futures = [pool.submit(copy, src, dest) for src, dest in pairs]
+        done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in done:
+            if future.exception() is not None:
+                pool.shutdown(cancel_futures=True)
+                raise future.exception()
+
+
+def _reflink(fsrc, fdst) -> bool:
+    """Try to clone fsrc into fdst (copy-on-write). Returns False if unsupported."""
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    try:
+        fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        return True
+    except OSError:
+        return False
+
+
+def _kernel_copy(fsrc, fdst) -> bool:
+    """
+    Copy fsrc into fdst inside the kernel with copy_file_range(2), or sendfile(2)
+    where that is unavailable. Returns False if neither works for these files.
+    """
+    infd, outfd = fsrc.fileno(), fdst.fileno()
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        copied = 0
+        try:
+            while True:
+                n = copy_file_range(infd, outfd, _KERNEL_COPY_CHUNK)
+                if n == 0:
+                    return True
+                copied += n
+        except OSError:
+            # Unsupported for this pair of files (e.g. cross-device on older kernels)
+            if copied:
+                raise
+    sendfile = getattr(os, "sendfile", None)
+    if sendfile is not None:
+        offset = 0
+        try:
+            while True:
+                n = sendfile(outfd, infd, offset, _KERNEL_COPY_CHUNK)
+                if n == 0:
+                    return True
+                offset += n
+        except OSError:
+            if offset:
+                raise
+    return False
+
+
+def _copy_local_file(src: str, dest: str, try_reflink: bool = True) -> bool:
+    """
+    Copy a local file: clone it when the filesystem supports reflinks
+    (btrfs, xfs), otherwise copy in the kernel, otherwise through a buffer.
+    Permission bits and timestamps are copied too, as with shutil.copy2.
+    Returns True if the file was cloned.
+    """
+    with builtins.open(src, "rb") as fsrc, builtins.open(dest, "wb") as fdst:
+        cloned = try_reflink and _reflink(fsrc, fdst)
+        if not cloned and not _kernel_copy(fsrc, fdst):
+            shutil.copyfileobj(fsrc, fdst, _COPY_BUFSIZE)
+    try:
+        shutil.copystat(src, dest)
+    except OSError:
+        # The data is copied; metadata is best effort (e.g. on some network mounts)
+        pass
+    return cloned
+
+
+def _copy_local_tree(src_dir: str, dest_dir: str) -> None:
+    """Copy a local directory tree, copying files on a thread pool."""
+    files = []
+    pending = [(src_dir, dest_dir)]
+    while pending:
+        src, dest = pending.pop()
+        _ensure_dir(dest)
+        with os.scandir(src) as it:
+            for entry in it:
+                target = os.path.join(dest, entry.name)
+                if entry.is_dir():
+                    pending.append((entry.path, target))
+                else:
+                    files.append((entry.path, target))
+    if not files:
+        return
+
+    # Probe reflink support with the first file so that trees with many small
+    # files don't pay for a failing clone ioctl on every file
+    try_reflink = _copy_local_file(*files[0])
+    rest = files[1:]
+    if len(rest) <= 1:
+        for src, dest in rest:
+            _copy_local_file(src, dest, try_reflink)
+        return
+    _copy_pairs(
+        lambda src, dest: _copy_local_file(src, dest, try_reflink), rest, _copy_workers()
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _fs_for_protocol(protocol: str):
+    if _AWS_PROFILE and protocol in ("s3", "s3a"):
+        return fsspec.filesystem(protocol, profile=_AWS_PROFILE)
+    return fsspec.filesystem(protocol)
+
+
+def _fs_for(url: str):
+    """
+    Return the filesystem for url, reusing one instance per protocol so that
+    copying many files does not parse each URL into a new filesystem. URLs on
+    the configured storage's protocol use that (already cached) filesystem,
+    so copies get the same credentials as every other storage call.
+    """
+    if "::" in url:
+        # Chained URLs (e.g. "simplecache::s3://...") need fsspec's full parsing
+        return fsspec.core.url_to_fs(url)[0]
+    protocol, _ = fsspec.core.split_protocol(url)
+    protocol = protocol or "file"
+    fs = filesystem()
+    fs_protocols = (fs.protocol,) if isinstance(fs.protocol, str) else fs.protocol
+    if protocol in fs_protocols:
+        return fs
+    return _fs_for_protocol(protocol)
+
+
 def copy_file(src: str, dest: str) -> None:
     """Copy a single file from src to dest across arbitrary filesystems."""
+    if "://" not in src and is_local(dest):
+        _copy_local_file(src, dest)
+        return
+    try:
+        _copy_file_across(src, dest)
+    finally:
+        # A cached answer for dest may no longer hold
+        _invalidate_stat_cache()
+
+
+def _copy_file_across(src: str, dest: str) -> None:
+    """copy_file between filesystems, or within one that is not plain local paths."""
     # Use streaming copy to be robust across different filesystems
-    with fsspec.open(src, "rb") as r, fsspec.open(dest, "wb") as w:
-        for chunk in iter_chunks(r):
+    src_fs, dest_fs = _fs_for(src), _fs_for(dest)
+    if src_fs is dest_fs and not isinstance(src_fs, LocalFileSystem):
+        # Same store: server-side copy, no data passes through this process
+        src_fs.copy(src, dest)
+        return
+    # Between an async store and local disk, use its native transfer (s3fs
+    # uses concurrent multipart uploads for large files)
+    if isinstance(src_fs, AsyncFileSystem) and isinstance(dest_fs, LocalFileSystem):
+        src_fs.get_file(src, dest_fs._strip_protocol(dest))
+        return
+    if isinstance(src_fs, LocalFileSystem) and isinstance(dest_fs, AsyncFileSystem):
+        dest_fs.put_file(src_fs._strip_protocol(src), dest)
+        return
+    # Matching block sizes make each remote read/upload part one buffer
+    chunk_size = _stream_chunk_size()
+    with src_fs.open(src, "rb", block_size=chunk_size) as r:
+        with dest_fs.open(dest, "wb", block_size=chunk_size) as w:
+            _stream_copy(r, w, chunk_size)
+
+
+def _stream_copy(r, w, chunk_size: int) -> None:
+    """
+    Copy file object r into w, reading into one reused buffer instead of
+    allocating a new bytes object per chunk.
+    """
+    readinto = getattr(r, "readinto", None)
+    if readinto is None:
+        for chunk in iter_chunks(r, chunk_size):
             w.write(chunk)
+        return
+    buf = bytearray(chunk_size)
+    view = memoryview(buf)
+    while True:
+        n = readinto(buf)
+        if not n:
+            break
+        w.write(view[:n])
 
 
-def iter_chunks(file_obj, chunk_size: int = 8 * 1024 * 1024):
-    """Helper to read file in chunks."""
+def iter_chunks(file_obj, chunk_size: int | None = None):
+    """Helper to read file in chunks (TFL_COPY_CHUNK_MB by default)."""
+    if chunk_size is None:
+        chunk_size = _stream_chunk_size()
     while True:
         data = file_obj.read(chunk_size)
         if not data:
@@ -183,27 +564,114 @@ def iter_chunks(file_obj, chunk_size: int = 8 * 1024 * 1024):
         yield data
 
 
-def copy_dir(src_dir: str, dest_dir: str) -> None:
-    """Recursively copy a directory tree across arbitrary filesystems."""
-    makedirs(dest_dir, exist_ok=True)
+def _makedirs_on(fs, path: str) -> None:
+    """makedirs(path, exist_ok=True) on a specific filesystem."""
+    if isinstance(fs, LocalFileSystem):
+        _ensure_dir(fs._strip_protocol(path))
+        return
+    try:
+        fs.makedirs(path, exist_ok=True)
+    except TypeError:
+        # Some filesystems don't support exist_ok parameter
+        if not fs.exists(path):
+            fs.makedirs(path)
+
+
+def copy_dir(src_dir: str, dest_dir: str, max_concurrency: int | None = None) -> None:
+    """
+    Recursively copy a directory tree across arbitrary filesystems.
+    max_concurrency caps how many files are transferred at once (defaults to
+    the filesystem's own batch size, or _copy_workers() threads).
+    """
+    if "://" not in src_dir and is_local(dest_dir):
+        _copy_local_tree(src_dir, dest_dir)
+        return
+    try:
+        _copy_dir_across(src_dir, dest_dir, max_concurrency)
+    finally:
+        # Cached answers for paths under dest_dir may no longer hold
+        _invalidate_stat_cache()
+
+
+def _copy_dir_across(src_dir: str, dest_dir: str, max_concurrency: int | None) -> None:
+    """copy_dir between filesystems, or within one that is not plain local paths."""
+    dest_fs = _fs_for(dest_dir)
+    _makedirs_on(dest_fs, dest_dir)
     # Determine the source filesystem independently of destination
-    src_fs, _ = fsspec.core.url_to_fs(src_dir)
+    src_fs = _fs_for(src_dir)
     try:
         src_files = src_fs.find(src_dir)
     except Exception:
         # If find is not available, fall back to listing via walk
         src_files = []
-        for _, _, files in src_fs.walk(src_dir):
+        for root, _, files in src_fs.walk(src_dir):
             for f in files:
-                src_files.append(f)
-
+                src_files.append(posixpath.join(root, f))
+
+    # Listed paths come back without the protocol, so compare against the
+    # stripped source root
+    src_root = src_fs._strip_protocol(src_dir).rstrip("/")
+    src_prefix = src_root + "/"
+    pairs = []
+    dest_parents = set()
     for src_file in src_files:
-        # Compute relative path with respect to the source dir
-        rel_path = src_file[len(src_dir):].lstrip("/")
+        # Compute relative path with respect to the source dir (relpath for
+        # any entry not spelled with the root as a prefix)
+        if src_file.startswith(src_prefix):
+            rel_path = src_file[len(src_prefix):]
+        else:
+            rel_path = posixpath.relpath(src_file, src_root)
         dest_file = join(dest_dir, rel_path)
-        # Ensure destination directory exists
         dest_parent = posixpath.dirname(dest_file)
         if dest_parent:
-            makedirs(dest_parent, exist_ok=True)
-        # Copy the file using streaming (robust across FSes)
-        copy_file(src_file, dest_file)
\ No newline at end of file
+            dest_parents.add(dest_parent)
+        pairs.append((src_file, dest_file))
+    if not pairs:
+        return
+
+    # Ensure destination directories exist, including before a same-store bulk
+    # copy (local stores do not create parents). makedirs creates missing
+    # parents, so only the deepest directories below dest_dir (created above)
+    # need a call.
+    root = dest_dir.rstrip("/")
+    leaf_parents = set(dest_parents)
+    for dest_parent in dest_parents:
+        ancestor = posixpath.dirname(dest_parent)
+        while len(ancestor) > len(root):
+            leaf_parents.discard(ancestor)
+            ancestor = posixpath.dirname(ancestor)
+    leaf_parents.discard(root)
+    for dest_parent in sorted(leaf_parents):
+        _makedirs_on(dest_fs, dest_parent)
+
+    srcs = [src for src, _ in pairs]
+    dests = [dest for _, dest in pairs]
+    # batch_size is understood by the bulk methods of async filesystems only
+    batch_kwargs = {}
+    if max_concurrency and (
+        isinstance(src_fs, AsyncFileSystem) or isinstance(dest_fs, AsyncFileSystem)
+    ):
+        batch_kwargs["batch_size"] = max_concurrency
+    if dest_fs is src_fs:
+        # Same store: let the filesystem copy the whole batch (server-side
+        # copies, issued concurrently by async stores such as s3fs)
+        src_fs.copy(srcs, dests, **batch_kwargs)
+        return
+
+    # Between an async store (s3fs, gcsfs, ...) and local disk, fsspec's bulk
+    # get/put gathers the transfers on its event loop
+    if isinstance(src_fs, AsyncFileSystem) and isinstance(dest_fs, LocalFileSystem):
+        src_fs.get(srcs, dests, **batch_kwargs)
+        return
+    if isinstance(src_fs, LocalFileSystem) and isinstance(dest_fs, AsyncFileSystem):
+        dest_fs.put(srcs, dests, **batch_kwargs)
+        return
+
+    # Otherwise copy the files using streaming (robust across FSes). Remote
+    # copies are latency bound, so several run at once.
+    pairs = [(src_fs.unstrip_protocol(src), dest) for src, dest in pairs]
+    if len(pairs) <= 1:
+        for src_file, dest_file in pairs:
+            copy_file(src_file, dest_file)
+        return
+    _copy_pairs(copy_file, pairs, max_concurrency or _copy_workers())
@@ -1,4 +1,6 @@
-from datetime import datetime
+import functools
+import os
+import time
 from werkzeug.utils import secure_filename
 
 from .dirs import get_tasks_dir
@@ -6,14 +8,39 @@ from .labresource import BaseLabResource
 from . import storage
 
 
+# secure_filename normalizes unicode and runs regexes; task ids repeat a lot
+# (every Task(...) built while listing), so remember the results
+_safe_task_id = functools.lru_cache(maxsize=1024)(secure_filename)
+
+
+@functools.lru_cache(maxsize=1)
+def _utc_second_iso(seconds: int) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+
+
+def _utc_now_iso() -> str:
+    """
+    Current UTC time in the format datetime.utcnow().isoformat() produces.
+    The date/time part is formatted once per second.
+    """
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    micros = nanos // 1000
+    if micros:
+        return f"{_utc_second_iso(seconds)}.{micros:06d}"
+    return _utc_second_iso(seconds)
+
+
 class Task(BaseLabResource):
     def get_dir(self):
         """Abstract method on BaseLabResource"""
-        task_id_safe = secure_filename(str(self.id))
-        return storage.join(get_tasks_dir(), task_id_safe)
+        if self._dir is None:
+            task_id_safe = _safe_task_id(str(self.id))
+            self._dir = storage.join(get_tasks_dir(), task_id_safe)
+        return self._dir
 
     def _default_json(self):
         # Default metadata modeled after API tasks table fields
+        now = _utc_now_iso()
         return {
             "id": self.id,
             "name": "",
@@ -24,8 +51,8 @@ class Task(BaseLabResource):
             "outputs": {},
             "experiment_id": None,
             "remote_task": False,
-            "created_at": datetime.utcnow().isoformat(),
-            "updated_at": datetime.utcnow().isoformat(),
+            "created_at": now,
+            "updated_at": now,
         }
 
     def set_metadata(self, *, name: str | None = None, type: str | None = None, 
@@ -53,13 +80,14 @@ class Task(BaseLabResource):
 
         
         # Always update the updated_at timestamp
-        data["updated_at"] = datetime.utcnow().isoformat()
+        data["updated_at"] = _utc_now_iso()
         self._set_json_data(data)
 
     def get_metadata(self):
         """Get task metadata"""
-        data = self.get_json_data()
-        
+        return self._normalize_metadata(self.get_json_data())
+
+    def _normalize_metadata(self, data):
         # Fix experiment_id if it's a digit - convert to experiment name
         if data.get("experiment_id") and str(data["experiment_id"]).isdigit():
             experiment_name = self._get_experiment_name_by_id(data["experiment_id"])
@@ -87,13 +115,22 @@ class Task(BaseLabResource):
             return experiment_id
 
     @staticmethod
-    def list_all():
-        """List all tasks in the filesystem"""
-        results = []
+    def _iter_ids():
+        """Yield the id of every task directory in the filesystem"""
         tasks_dir = get_tasks_dir()
         if not storage.isdir(tasks_dir):
             print(f"Tasks directory does not exist: {tasks_dir}")
-            return results
+            return
+        if storage.is_local(tasks_dir):
+            # scandir answers is_dir() from the directory listing itself
+            try:
+                with os.scandir(tasks_dir) as it:
+                    entries = [e.name for e in it if e.is_dir()]
+            except OSError as e:
+                print(f"Exception listing tasks directory: {e}")
+                return
+            yield from entries
+            return
         try:
             
             entries = storage.ls(tasks_dir, detail=False)
@@ -103,12 +140,33 @@ class Task(BaseLabResource):
         for full in entries:
             if not storage.isdir(full):
                 continue
+            yield full.rstrip("/").split("/")[-1]
+
+    @staticmethod
+    def _list(task_type: str | None = None):
+        """
+        List task metadata, optionally only for one type. The type is checked
+        on the raw metadata so non-matching tasks skip get_metadata().
+        """
+        results = []
+        task_ids = list(Task._iter_ids())
+        prefetched = None
+        if task_ids and not storage.is_local(get_tasks_dir()):
+            # Remote stores: fetch every index.json in one batched call
+            prefetched = storage.cat_files(
+                [Task(entry)._get_json_file() for entry in task_ids]
+            )
+        for i, entry in enumerate(task_ids):
             # Attempt to read index.json (or latest snapshot)
             try:
-                entry = full.rstrip("/").split("/")[-1]
                 task = Task(entry)
-
-                results.append(task.get_metadata())
+                if prefetched is not None:
+                    data = task._json_from_bytes(prefetched[i])
+                else:
+                    data = task.get_json_data()
+                if task_type is not None and data.get("type") != task_type:
+                    continue
+                results.append(task._normalize_metadata(data))
             except Exception:
                 print(f"Exception getting metadata for task: {entry}")
                 continue
@@ -116,11 +174,15 @@ class Task(BaseLabResource):
         results.sort(key=lambda x: x.get("created_at", ""), reverse=True)
         return results
 
+    @staticmethod
+    def list_all():
+        """List all tasks in the filesystem"""
+        return Task._list()
+
     @staticmethod
     def list_by_type(task_type: str):
         """List all tasks of a specific type"""
-        all_tasks = Task.list_all()
-        return [task for task in all_tasks if task.get("type") == task_type]
+        return Task._list(task_type)
 
     @staticmethod
     def list_by_experiment(experiment_id: int):
@@ -131,9 +193,8 @@ class Task(BaseLabResource):
     @staticmethod
     def list_by_type_in_experiment(task_type: str, experiment_id: int):
         """List all tasks of a specific type in a specific experiment"""
-        all_tasks = Task.list_all()
-        return [task for task in all_tasks 
-                if task.get("type") == task_type and task.get("experiment_id") == experiment_id]
+        tasks = Task._list(task_type)
+        return [task for task in tasks if task.get("experiment_id") == experiment_id]
 
     @staticmethod
     def get_by_id(task_id: str):
@@ -150,10 +211,7 @@ class Task(BaseLabResource):
         tasks_dir = get_tasks_dir()
         if not storage.isdir(tasks_dir):
             return
-        try:
-            entries = storage.ls(tasks_dir, detail=False)
-        except Exception:
-            entries = []
-        for full in entries:
-            if storage.isdir(full):
-                storage.rm_tree(full)
+        # Only task directories are removed; other files in tasks_dir are kept.
+        # _iter_ids lists the directory once instead of an isdir() per entry.
+        for task_id in list(Task._iter_ids()):
+            storage.rm_tree(storage.join(tasks_dir, task_id))
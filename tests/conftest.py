@@ -1,13 +1,18 @@
 import os
+import shutil
 import sys
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
 import pytest
 
 
 @pytest.fixture(autouse=True)
 def _isolate_imports_and_home(monkeypatch, tmp_path):
     """
-    Ensure imports are fresh each test and HOME is isolated to tmp.
+    Ensure the src dir is importable and HOME is isolated to tmp.
     Do not force TFL_* env; individual tests control those if needed.
+    lab.dirs resolves the TFL_* env on each call, so modules are not re-imported.
     """
     repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
     src_dir = os.path.join(repo_root, "src")
@@ -17,11 +22,47 @@ def _isolate_imports_and_home(monkeypatch, tmp_path):
     # Isolate HOME to avoid touching real user dirs for default-path tests
     monkeypatch.setenv("HOME", str(tmp_path))
 
-    # Clear lab modules so module-level env evaluation re-runs every test
-    for mod in ["lab", "lab.dirs"]:
-        if mod in sys.modules:
-            sys.modules.pop(mod)
-
     yield
 
 
+@pytest.fixture(scope="session")
+def _tfl_base(tmp_path_factory):
+    return tmp_path_factory.mktemp("tfl")
+
+
+@pytest.fixture
+def tfl_env(monkeypatch, _tfl_base):
+    """
+    Point TFL_HOME_DIR/TFL_WORKSPACE_DIR at fresh dirs under a session-wide base.
+    lab.dirs reads them on each call, so no re-import is needed.
+    Modules that need it for every test opt in via pytestmark usefixtures.
+    """
+    suffix = uuid.uuid4().hex
+    home = _tfl_base / f"home_{suffix}"
+    ws = _tfl_base / f"ws_{suffix}"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    yield home, ws
+
+    shutil.rmtree(home, ignore_errors=True)
+    shutil.rmtree(ws, ignore_errors=True)
+
+
+@dataclass
+class LabEnv:
+    Experiment: type
+    Job: type
+    home: Path
+    ws: Path
+
+
+@pytest.fixture
+def lab_env(tfl_env):
+    """The lab resource classes plus this test's home/ws dirs from tfl_env."""
+    from lab.experiment import Experiment
+    from lab.job import Job
+
+    return LabEnv(Experiment, Job, *tfl_env)
@@ -1,15 +1,7 @@
 import os
-import importlib
-
-
-def _fresh(monkeypatch):
-    for mod in ["lab.dataset", "lab.dirs"]:
-        if mod in importlib.sys.modules:
-            importlib.sys.modules.pop(mod)
 
 
 def test_dataset_get_dir(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -25,7 +17,6 @@ def test_dataset_get_dir(tmp_path, monkeypatch):
 
 
 def test_dataset_create_and_get(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -51,7 +42,6 @@ def test_dataset_create_and_get(tmp_path, monkeypatch):
 
 
 def test_dataset_default_json(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -71,7 +61,6 @@ def test_dataset_default_json(tmp_path, monkeypatch):
 
 
 def test_dataset_set_metadata(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -105,7 +94,6 @@ def test_dataset_set_metadata(tmp_path, monkeypatch):
 
 
 def test_dataset_get_metadata(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -124,7 +112,6 @@ def test_dataset_get_metadata(tmp_path, monkeypatch):
 
 
 def test_dataset_list_all(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -152,7 +139,6 @@ def test_dataset_list_all(tmp_path, monkeypatch):
 
 
 def test_dataset_list_all_empty_dir(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -169,7 +155,6 @@ def test_dataset_list_all_empty_dir(tmp_path, monkeypatch):
 
 
 def test_dataset_secure_filename(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -1,14 +1,4 @@
 import os
-import importlib
-
-
-def _fresh_import_dirs(monkeypatch):
-    for mod in ["lab.dirs"]:
-        if mod in importlib.sys.modules:
-            importlib.sys.modules.pop(mod)
-    from lab import dirs  # noqa: F401
-
-    return importlib.import_module("lab.dirs")
 
 
 def test_dirs_structure_created(monkeypatch, tmp_path):
@@ -19,7 +9,7 @@ def test_dirs_structure_created(monkeypatch, tmp_path):
     monkeypatch.setenv("TFL_HOME_DIR", str(home))
     monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
 
-    dirs = _fresh_import_dirs(monkeypatch)
+    from lab import dirs
 
     # Key directories exist
     assert os.path.isdir(dirs.get_experiments_dir())
@@ -1,48 +1,32 @@
 import os
-import importlib
 
 
-def test_default_dirs_created(monkeypatch, tmp_path):
-    # Unset env to test defaults and ensure fresh import
-    monkeypatch.delenv("TFL_HOME_DIR", raising=False)
-    monkeypatch.delenv("TFL_WORKSPACE_DIR", raising=False)
-
-    # Ensure fresh import
-    if "lab.dirs" in list(importlib.sys.modules.keys()):
-        importlib.sys.modules.pop("lab.dirs")
-
-    # HOME is already isolated via conftest
-
+def test_dirs_workspace_env(monkeypatch, tmp_path):
     from lab import dirs as dirs_workspace
 
-    assert os.path.isdir(dirs_workspace.HOME_DIR)
-    assert os.path.isdir(dirs_workspace.WORKSPACE_DIR)
-    # Default home is ~/.transformerlab under our isolated HOME
-    assert dirs_workspace.HOME_DIR.startswith(str(tmp_path))
+    # Defaults: no TFL_* env, HOME is already isolated via conftest
+    with monkeypatch.context() as m:
+        m.delenv("TFL_HOME_DIR", raising=False)
+        m.delenv("TFL_WORKSPACE_DIR", raising=False)
 
+        home_dir = dirs_workspace.get_home_dir()
+        assert home_dir == os.path.join(str(tmp_path), ".transformerlab")
+        assert os.path.isdir(home_dir)
+        ws_dir = dirs_workspace.get_workspace_dir()
+        assert ws_dir == os.path.join(home_dir, "workspace")
+        assert os.path.isdir(ws_dir)
 
-def test_env_override_existing_paths(monkeypatch, tmp_path):
-    # Create explicit dirs and set env
+    # Explicit overrides; lab.dirs reads the env on each call, so no re-import
     home = tmp_path / "custom_home"
     ws = tmp_path / "custom_ws"
     home.mkdir()
     ws.mkdir()
+    with monkeypatch.context() as m:
+        m.setenv("TFL_HOME_DIR", str(home))
+        m.setenv("TFL_WORKSPACE_DIR", str(ws))
 
-    # Ensure defaults are not set by previous tests
-    monkeypatch.delenv("TFL_HOME_DIR", raising=False)
-    monkeypatch.delenv("TFL_WORKSPACE_DIR", raising=False)
-
-    monkeypatch.setenv("TFL_HOME_DIR", str(home))
-    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
-
-    # Fresh import
-    if "lab.dirs" in list(importlib.sys.modules.keys()):
-        importlib.sys.modules.pop("lab.dirs")
-
-    from lab import dirs as dirs_workspace
-
-    assert dirs_workspace.HOME_DIR == str(home)
-    assert dirs_workspace.WORKSPACE_DIR == str(ws)
+        assert dirs_workspace.get_home_dir() == str(home)
+        assert dirs_workspace.get_workspace_dir() == str(ws)
 
 
 def test_org_scoped_workspace_dir(monkeypatch, tmp_path):
@@ -52,22 +36,37 @@ def test_org_scoped_workspace_dir(monkeypatch, tmp_path):
     home.mkdir()
     monkeypatch.setenv("TFL_HOME_DIR", str(home))
 
-    # Fresh import
-    if "lab.dirs" in list(importlib.sys.modules.keys()):
-        importlib.sys.modules.pop("lab.dirs")
-
     from lab import dirs as dirs_workspace
 
     # Set organization id → should route to org-scoped workspace
     dirs_workspace.set_organization_id("acme")
     ws = dirs_workspace.get_workspace_dir()
-    expected = os.path.join(dirs_workspace.HOME_DIR, "orgs", "acme", "workspace")
+    expected = os.path.join(dirs_workspace.get_home_dir(), "orgs", "acme", "workspace")
     assert ws == expected
     assert os.path.isdir(ws)
 
     # Reset organization_id → should fall back to default single-tenant path
     dirs_workspace.set_organization_id(None)
     ws_default = dirs_workspace.get_workspace_dir()
-    expected_default = os.path.join(dirs_workspace.HOME_DIR, "workspace")
+    expected_default = os.path.join(dirs_workspace.get_home_dir(), "workspace")
     assert ws_default == expected_default
     assert os.path.isdir(ws_default)
+
+
+def test_workspace_and_tasks_dirs_recreated_after_delete(monkeypatch, tmp_path):
+    import shutil
+
+    monkeypatch.delenv("TFL_WORKSPACE_DIR", raising=False)
+    home = tmp_path / "tfl_home"
+    home.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+
+    from lab import dirs as dirs_workspace
+
+    tasks_dir = dirs_workspace.get_tasks_dir()
+    ws_dir = dirs_workspace.get_workspace_dir()
+    shutil.rmtree(ws_dir)
+
+    assert dirs_workspace.get_tasks_dir() == tasks_dir
+    assert os.path.isdir(tasks_dir)
+    assert os.path.isdir(ws_dir)
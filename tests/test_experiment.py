@@ -1,92 +1,137 @@
 import os
 import json
-import importlib
+from pathlib import Path
+import pytest
 
+pytestmark = pytest.mark.usefixtures("tfl_env")
 
-def _fresh(monkeypatch):
-    for mod in ["lab.experiment", "lab.job", "lab.dirs"]:
-        if mod in importlib.sys.modules:
-            importlib.sys.modules.pop(mod)
 
+def _dir_has(parent, names):
+    # One scandir of the parent instead of a stat per expected file
+    return {e.name for e in os.scandir(parent) if e.is_file()} >= names
 
-def test_experiment_dir_and_jobs_index(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
-    home = tmp_path / ".tfl_home"
-    ws = tmp_path / ".tfl_ws"
-    home.mkdir()
-    ws.mkdir()
-    monkeypatch.setenv("TFL_HOME_DIR", str(home))
-    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
-
-    from lab.experiment import Experiment
-    from lab.job import Job
 
-    exp = Experiment.create("exp1")
+def test_experiment_dir_and_jobs_index(lab_env):
+    exp = lab_env.Experiment.create("exp1")
     exp_dir = exp.get_dir()
     assert exp_dir.endswith(os.path.join("experiments", "exp1"))
-    assert os.path.isdir(exp_dir)
-
-    # jobs.json created with default
-    jobs_index_file = os.path.join(exp_dir, "jobs.json")
-    assert os.path.isfile(jobs_index_file)
-    with open(jobs_index_file) as f:
-        data = json.load(f)
+    # Experiment dir holds index.json and a default jobs.json
+    assert _dir_has(exp_dir, {"index.json", "jobs.json"})
+    data = json.loads(Path(exp_dir, "jobs.json").read_bytes())
     assert "index" in data
     assert "TRAIN" in data["index"]
 
-    # Create two jobs and assign to experiment
-    j1 = Job.create("10")
-    j1.set_experiment("exp1", sync_rebuild=True)
-    j2 = Job.create("11")
-    j2.set_experiment("exp1", sync_rebuild=True)
+    # Create two jobs and assign to experiment; jobs.json is rebuilt once
+    # when the batch exits, not per set_experiment
+    with exp.batch_update():
+        j1 = lab_env.Job.create("10")
+        j1.set_experiment("exp1", sync_rebuild=True)
+        j2 = lab_env.Job.create("11")
+        j2.set_experiment("exp1", sync_rebuild=True)
+        assert exp._get_all_jobs() == []
 
     all_jobs = exp._get_all_jobs()
     assert set(all_jobs) >= {"10", "11"}
 
 
-def test_get_jobs_filters(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
-    home = tmp_path / ".tfl_home"
-    ws = tmp_path / ".tfl_ws"
-    home.mkdir()
-    ws.mkdir()
-    monkeypatch.setenv("TFL_HOME_DIR", str(home))
-    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+def test_batch_update_rebuilds_once_and_only_defers_own_thread(lab_env, monkeypatch):
+    import threading
+
+    exp = lab_env.Experiment.create("exp_batch")
+    rebuilds = []
+    real_rebuild = lab_env.Experiment.rebuild_jobs_index
+
+    def counting_rebuild(self, workspace_dir=None):
+        rebuilds.append(threading.current_thread().name)
+        return real_rebuild(self, workspace_dir=workspace_dir)
 
-    from lab.experiment import Experiment
-    from lab.job import Job
+    monkeypatch.setattr(lab_env.Experiment, "rebuild_jobs_index", counting_rebuild)
 
-    exp = Experiment.create("exp2")
+    with exp.batch_update():
+        with exp.batch_update():
+            for job_id in ("30", "31"):
+                lab_env.Job.create(job_id).set_experiment("exp_batch", sync_rebuild=True)
+        # Another thread's rebuild is not held back by this thread's batch
+        other = threading.Thread(
+            target=lambda: exp._trigger_cache_rebuild(str(lab_env.ws), sync=True), name="other"
+        )
+        other.start()
+        other.join()
+        assert rebuilds == ["other"]
 
-    j1 = Job.create("21")
-    j1.set_experiment("exp2", sync_rebuild=True)
-    j1.update_status("RUNNING")
+    assert rebuilds == ["other", threading.current_thread().name]
+    assert set(exp._get_all_jobs()) >= {"30", "31"}
 
-    j2 = Job.create("22")
-    j2.set_experiment("exp2", sync_rebuild=True)
-    j2.update_status("NOT_STARTED")
 
-    # get all
-    jobs = exp.get_jobs()
-    assert isinstance(jobs, list)
-    # filter by status
-    running = exp.get_jobs(status="RUNNING")
-    assert all(j.get("status") == "RUNNING" for j in running)
+def test_batch_update_writes_added_jobs_once(lab_env, monkeypatch):
+    exp = lab_env.Experiment.create("exp_added")
+    jobs_json = Path(exp.get_dir(), "jobs.json")
+    before = jobs_json.read_bytes()
+    writes = []
+    real_write = lab_env.Experiment._write_added_jobs
 
+    def counting_write(self, added):
+        writes.append(list(added))
+        return real_write(self, added)
 
-def test_experiment_create_and_get(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
-    home = tmp_path / ".tfl_home"
-    ws = tmp_path / ".tfl_ws"
+    monkeypatch.setattr(lab_env.Experiment, "_write_added_jobs", counting_write)
+
+    with exp.batch_update():
+        with exp.batch_update():
+            exp._add_job("40", "TRAIN")
+        exp._add_job("41", "EVAL")
+        exp._add_job("42", "TRAIN")
+        assert jobs_json.read_bytes() == before
+
+    assert writes == [[("40", "TRAIN"), ("41", "EVAL"), ("42", "TRAIN")]]
+    index = json.loads(jobs_json.read_bytes())["index"]
+    assert index["TRAIN"] == ["40", "42"]
+    assert index["EVAL"] == ["41"]
+
+
+@pytest.fixture(scope="module")
+def populated_experiment(tmp_path_factory):
+    """Experiment exp2 with jobs 21 (RUNNING), 22 (NOT_STARTED) and 23 (COMPLETE), built once per module."""
+    base = tmp_path_factory.mktemp("populated")
+    home = base / ".tfl_home"
+    ws = base / ".tfl_ws"
     home.mkdir()
     ws.mkdir()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("TFL_HOME_DIR", str(home))
+        mp.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+        from lab.experiment import Experiment
+        from lab.job import Job
+
+        exp = Experiment.create("exp2")
+        with exp.batch_update():
+            for job_id, status in [("21", "RUNNING"), ("22", "NOT_STARTED"), ("23", "COMPLETE")]:
+                job = Job.create(job_id)
+                job.set_experiment("exp2", sync_rebuild=True)
+                job.update_status(status)
+    return exp, home, ws
+
+
+@pytest.mark.parametrize(
+    "status,expected",
+    [("RUNNING", {"21"}), ("NOT_STARTED", {"22"}), (None, {"21", "22", "23"})],
+)
+def test_get_jobs_filters(populated_experiment, monkeypatch, status, expected):
+    exp, home, ws = populated_experiment
     monkeypatch.setenv("TFL_HOME_DIR", str(home))
     monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
 
-    from lab.experiment import Experiment
+    jobs = exp.get_jobs(status=status or "")
+    assert type(jobs) is list
+    assert {j["id"] for j in jobs} == expected
+    if status:
+        assert all(j.get("status") == status for j in jobs)
+
 
+def test_experiment_create_and_get(lab_env):
     # Create experiment and verify it exists
-    exp = Experiment.create("test_experiment")
+    exp = lab_env.Experiment.create("test_experiment")
     assert exp is not None
 
     # Get the experiment and verify its properties
@@ -95,7 +140,7 @@ def test_experiment_create_and_get(tmp_path, monkeypatch):
 
     # Try to get an experiment that doesn't exist
     try:
-        nonexistent = Experiment.get("999999")
+        nonexistent = lab_env.Experiment.get("999999")
         # If we get here, the experiment should be None or indicate it doesn't exist
         assert nonexistent is None
     except Exception:
@@ -103,24 +148,14 @@ def test_experiment_create_and_get(tmp_path, monkeypatch):
         pass
 
 
-def test_experiment_config_validation(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
-    home = tmp_path / ".tfl_home"
-    ws = tmp_path / ".tfl_ws"
-    home.mkdir()
-    ws.mkdir()
-    monkeypatch.setenv("TFL_HOME_DIR", str(home))
-    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
-
-    from lab.experiment import Experiment
-
+def test_experiment_config_validation(lab_env):
     # Test creating experiment with valid config
-    exp = Experiment.create_with_config("test_experiment_config", {"key": "value"})
+    exp = lab_env.Experiment.create_with_config("test_experiment_config", {"key": "value"})
     assert exp is not None
 
     # Test creating experiment with invalid config (string instead of dict)
     try:
-        Experiment.create_with_config("test_experiment_invalid", "not_a_dict")
+        lab_env.Experiment.create_with_config("test_experiment_invalid", "not_a_dict")
         assert False, "Should have raised an exception for invalid config"
     except TypeError:
         # Expected behavior - should raise TypeError for non-dict config
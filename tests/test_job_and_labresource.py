@@ -1,80 +1,182 @@
 import os
 import json
-import importlib
+from pathlib import Path
+import pytest
 
+pytestmark = pytest.mark.usefixtures("tfl_env")
 
-def test_baselabresource_create_get(tmp_path, monkeypatch):
-    # Create a simple subclass inline by importing Job which uses BaseLabResource
-    for mod in ["lab.job", "lab.dirs"]:
-        if mod in importlib.sys.modules:
-            importlib.sys.modules.pop(mod)
 
-    home = tmp_path / ".tfl_home"
-    ws = tmp_path / ".tfl_ws"
-    home.mkdir()
-    ws.mkdir()
-    monkeypatch.setenv("TFL_HOME_DIR", str(home))
-    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+@pytest.mark.parametrize(
+    "scenario", ["create_get", "defaults_updates", "update_many", "completion_status"]
+)
+def test_job_lifecycle(scenario, lab_env, monkeypatch):
+    if scenario == "create_get":
+        job = lab_env.Job.create("123")
+        assert os.path.isdir(job.get_dir())
+        index_file = os.path.join(job.get_dir(), "index.json")
+        assert os.path.isfile(index_file)
 
-    from lab.job import Job
+        job2 = lab_env.Job.get("123")
+        assert isinstance(job2, lab_env.Job)
 
-    job = Job.create("123")
-    assert os.path.isdir(job.get_dir())
-    index_file = os.path.join(job.get_dir(), "index.json")
-    assert os.path.isfile(index_file)
+    elif scenario == "defaults_updates":
+        job = lab_env.Job.create("1")
+        # On create, defaults are written to index.json
+        data = job.get_json_data()
+        assert data["status"] == "NOT_STARTED"
+        assert data["progress"] == 0
 
-    job2 = Job.get("123")
-    assert isinstance(job2, Job)
+        job.update_status("RUNNING")
+        job.update_progress(50)
+        job.update_job_data_field("k", "v")
 
+        # After updates, read using BaseLabResource helper (prefers latest snapshot)
+        data = job.get_json_data()
+        assert data["status"] == "RUNNING"
+        assert data["progress"] == 50
+        assert data["job_data"]["k"] == "v"
 
-def test_job_default_json_and_updates(tmp_path, monkeypatch):
-    for mod in ["lab.job", "lab.dirs"]:
-        if mod in importlib.sys.modules:
-            importlib.sys.modules.pop(mod)
+    elif scenario == "update_many":
+        job = lab_env.Job.create("2")
+        job.update_job_data_field("keep", 1)
+        writes = []
+        real_write = job._write_json_file
 
-    home = tmp_path / ".tfl_home"
-    ws = tmp_path / ".tfl_ws"
-    home.mkdir()
-    ws.mkdir()
-    monkeypatch.setenv("TFL_HOME_DIR", str(home))
-    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+        def counting_write(data):
+            writes.append(data)
+            real_write(data)
 
-    from lab.job import Job
+        monkeypatch.setattr(job, "_write_json_file", counting_write)
 
-    job = Job.create("1")
-    # On create, defaults are written to index.json
-    data_path = os.path.join(job.get_dir(), "index.json")
-    with open(data_path) as f:
-        data = json.load(f)
-    assert data["status"] == "NOT_STARTED"
-    assert data["progress"] == 0
+        # Status, progress and job_data reach index.json in a single write
+        job.update_many(status="RUNNING", progress=50, job_data={"k": "v"})
 
-    job.update_status("RUNNING")
-    job.update_progress(50)
+        assert len(writes) == 1
+        data = job.get_json_data()
+        assert data["status"] == "RUNNING"
+        assert data["progress"] == 50
+        assert data["job_data"]["keep"] == 1
+        assert data["job_data"]["k"] == "v"
+
+    elif scenario == "completion_status":
+        job = lab_env.Job.create("4")
+        job.set_job_completion_status(
+            "success", "done", score={"acc": 1}, plot_data_path="", progress=100, status="COMPLETE"
+        )
+
+        data = job.get_json_data()
+        assert data["status"] == "COMPLETE"
+        assert data["progress"] == 100
+        assert data["job_data"]["completion_status"] == "success"
+        assert data["job_data"]["completion_details"] == "done"
+        assert data["job_data"]["score"] == {"acc": 1}
+        assert "plot_data_path" not in data["job_data"]
+
+
+def test_baselabresource_set_then_get_json_data(lab_env):
+    job = lab_env.Job.create("5")
+    job._set_json_data({"id": "5", "status": "QUEUED"})
+    assert job.get_json_data() == {"id": "5", "status": "QUEUED"}
+    assert job._get_json_data_field("status") == "QUEUED"
+
+
+def test_baselabresource_json_roundtrip(lab_env):
+    job = lab_env.Job.create("7")
+    job.update_job_data_fields({"name": "caf\u00e9", "steps": {1: "a"}, "big": 2**70})
+    job_data = job.get_job_data()
+    assert job_data["name"] == "caf\u00e9"
+    assert job_data["steps"] == {"1": "a"}
+    assert job_data["big"] == 2**70
+    # Non-finite floats survive the round trip whether or not orjson is installed
+    job.update_job_data_fields({"loss": float("nan"), "best": float("inf")})
+    job_data = job.get_job_data()
+    assert job_data["loss"] != job_data["loss"]
+    assert job_data["best"] == float("inf")
+    # Written via a temp file that is renamed into place
+    assert not [name for name in os.listdir(job.get_dir()) if name.endswith(".tmp")]
+
+    # Files written by the stdlib encoder may contain NaN, and must still load
+    Path(job.get_dir(), "index.json").write_bytes(b'{"id": "7", "job_data": {"score": NaN}}%\n')
+    assert job.get_job_data()["score"] != job.get_job_data()["score"]
+
+
+def test_baselabresource_json_cache_sees_external_writes(lab_env):
+    job = lab_env.Job.create("8")
     job.update_job_data_field("k", "v")
+    # Each read returns its own dict, so mutating one does not leak into the next
+    job.get_job_data()["k"] = "changed"
+    assert job.get_job_data()["k"] == "v"
 
-    # After updates, read using BaseLabResource helper (prefers latest snapshot)
+    # Changes made by another process or resource object are picked up
+    lab_env.Job.get("8").update_job_data_field("k", "other")
+    assert job.get_job_data()["k"] == "other"
+    Path(job.get_dir(), "index.json").write_bytes(b'{"id": "8", "job_data": {"k": "external"}}')
+    assert job.get_job_data()["k"] == "external"
+
+
+def test_baselabresource_buffered_updates(lab_env):
+    job = lab_env.Job.create("9")
+    job.update_fields(status="RUNNING", progress=10)
     data = job.get_json_data()
     assert data["status"] == "RUNNING"
-    assert data["progress"] == 50
+    assert data["progress"] == 10
+
+    index_file = Path(job.get_dir(), "index.json")
+    with job.buffered():
+        job.update_progress(60)
+        job.update_job_data_field("k", "v")
+        # Reads inside the block see the buffered values; the file is unchanged
+        assert job.get_progress() == 60
+        assert json.loads(index_file.read_bytes())["progress"] == 10
+    data = lab_env.Job.get("9").get_json_data()
+    assert data["progress"] == 60
     assert data["job_data"]["k"] == "v"
 
+    # Nothing is written when the block raises
+    try:
+        with job.buffered():
+            job.update_progress(99)
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    assert job.get_progress() == 60
+
+
+def test_baselabresource_migrates_timestamped_index(lab_env):
+    job = lab_env.Job("10")
+    job_dir = job.get_dir()
+    os.makedirs(job_dir)
+    # Legacy layout: one file per write, newest last by timestamp
+    for name, progress in [
+        ("index-20240101T000000000000Z.json", 10),
+        ("index-20240102T000000000000Z.json", 20),
+        ("index-notatimestamp.json", 99),
+    ]:
+        with open(os.path.join(job_dir, name), "w") as f:
+            json.dump({"id": "10", "progress": progress}, f)
 
-def test_job_data_field_updates(tmp_path, monkeypatch):
-    for mod in ["lab.job", "lab.dirs"]:
-        if mod in importlib.sys.modules:
-            importlib.sys.modules.pop(mod)
+    assert job.get_progress() == 20
+    assert sorted(os.listdir(job_dir)) == ["index.json"]
 
-    home = tmp_path / ".tfl_home"
-    ws = tmp_path / ".tfl_ws"
-    home.mkdir()
-    ws.mkdir()
-    monkeypatch.setenv("TFL_HOME_DIR", str(home))
-    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+    # latest.txt takes precedence over the newest timestamp
+    job = lab_env.Job("11")
+    job_dir = job.get_dir()
+    os.makedirs(job_dir)
+    for name, progress in [
+        ("index-20240101T000000000000Z.json", 30),
+        ("index-20240102T000000000000Z.json", 40),
+    ]:
+        with open(os.path.join(job_dir, name), "w") as f:
+            json.dump({"id": "11", "progress": progress}, f)
+    with open(os.path.join(job_dir, "latest.txt"), "w") as f:
+        f.write("index-20240101T000000000000Z.json\n")
 
-    from lab.job import Job
+    assert job.get_progress() == 30
+    assert sorted(os.listdir(job_dir)) == ["index.json"]
 
-    job = Job.create("2")
+
+def test_job_data_field_updates(lab_env):
+    job = lab_env.Job.create("2")
     
     # Test updating job data fields directly
     job.update_job_data_field("completion_status", "success")
@@ -86,3 +188,89 @@ def test_job_data_field_updates(tmp_path, monkeypatch):
     assert data["job_data"]["completion_details"] == "ok"
     assert data["job_data"]["score"] == {"acc": 1}
 
+
+
+def test_job_log_info_buffers_until_flush(lab_env):
+    job = lab_env.Job.create("3")
+    # First message is written immediately, the next one within the interval is buffered
+    job.log_info("first")
+    job.log_info("second")
+    assert Path(job.get_log_path()).read_bytes() == b"first\n"
+
+    job.flush_logs()
+    assert Path(job.get_log_path()).read_bytes() == b"first\nsecond\n"
+
+    # Lines buffered on a handle that is dropped before its next flush are
+    # still written by the exit-time flush
+    import gc
+    from lab.job import _flush_pending_job_logs
+
+    handle = lab_env.Job.get("3")
+    handle.log_info("third")
+    handle.log_info("fourth")
+    del handle
+    gc.collect()
+    _flush_pending_job_logs()
+    assert Path(job.get_log_path()).read_bytes() == b"first\nsecond\nthird\nfourth\n"
+
+
+def test_job_log_info_shared_buffer_and_trailing_flush(lab_env, monkeypatch):
+    import time
+
+    monkeypatch.setattr(lab_env.Job, "LOG_FLUSH_INTERVAL", 0.05)
+    job = lab_env.Job.create("6")
+    log_file = Path(job.get_log_path())
+    # Unterminated output from e.g. a subprocess
+    log_file.write_bytes(b"progress 10%")
+
+    # Two handles on the same job write through one buffer, in call order
+    other = lab_env.Job.get("6")
+    job.log_info("a")
+    other.log_info("b")
+    job.log_info("c")
+    assert log_file.read_bytes() == b"progress 10%\na\n"
+
+    # The buffered lines are written by the timer without another log_info
+    deadline = time.monotonic() + 5
+    while log_file.read_bytes() != b"progress 10%\na\nb\nc\n" and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert log_file.read_bytes() == b"progress 10%\na\nb\nc\n"
+
+
+def test_job_update_job_data_fields(lab_env):
+    job = lab_env.Job.create("5")
+    job.update_job_data_field("kept", 1)
+    job.update_job_data_fields({"a": "x", "b": [1, 2]})
+
+    job_data = job.get_job_data()
+    assert job_data["kept"] == 1
+    assert job_data["a"] == "x"
+    assert job_data["b"] == [1, 2]
+
+
+def test_job_append_job_data_list(lab_env):
+    job = lab_env.Job.create("6")
+    job.append_job_data_list("checkpoints", "a")
+    job.append_job_data_list("checkpoints", "b", updates={"latest_checkpoint": "b"})
+
+    job_data = job.get_job_data()
+    assert job_data["checkpoints"] == ["a", "b"]
+    assert job_data["latest_checkpoint"] == "b"
+
+
+def test_job_log_info_from_several_threads(lab_env):
+    import threading
+
+    job = lab_env.Job.create("12")
+    threads = [
+        threading.Thread(target=lambda n=n: [job.log_info(f"{n}-{i}") for i in range(200)])
+        for n in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    job.flush_logs()
+
+    lines = Path(job.get_log_path()).read_text().splitlines()
+    assert sorted(lines) == sorted(f"{n}-{i}" for n in range(4) for i in range(200))
@@ -1,16 +1,8 @@
 import os
 import json
-import importlib
-
-
-def _fresh(monkeypatch):
-    for mod in ["lab.lab_facade", "lab.experiment", "lab.job", "lab.dirs", "lab.dataset", "lab.model"]:
-        if mod in importlib.sys.modules:
-            importlib.sys.modules.pop(mod)
 
 
 def test_lab_init(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -33,8 +25,26 @@ def test_lab_init(tmp_path, monkeypatch):
     assert "start_time" in job_data
 
 
+def test_lab_init_prints_job_id(lab_env, capsys):
+    from lab.lab_facade import Lab
+
+    lab = Lab()
+    lab.init(experiment_id="test_exp")
+    assert f"Created new job ID: {lab.job.id}" in capsys.readouterr().out
+
+
+def test_lab_supports_extra_attributes_and_weakrefs():
+    import weakref
+    from lab.lab_facade import Lab
+
+    lab = Lab()
+    # Callers and subclasses may attach their own state, and hold weak references
+    lab.run_name = "run-1"
+    assert lab.run_name == "run-1"
+    assert weakref.ref(lab)() is lab
+
+
 def test_lab_init_with_existing_job(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -62,7 +72,6 @@ def test_lab_init_with_existing_job(tmp_path, monkeypatch):
 
 
 def test_lab_init_with_nonexistent_job(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -82,7 +91,6 @@ def test_lab_init_with_nonexistent_job(tmp_path, monkeypatch):
 
 
 def test_lab_set_config(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -105,7 +113,6 @@ def test_lab_set_config(tmp_path, monkeypatch):
 
 
 def test_lab_set_config_merges_existing(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -121,16 +128,43 @@ def test_lab_set_config_merges_existing(tmp_path, monkeypatch):
     # Set initial config
     lab.set_config({"epochs": 10, "batch_size": 32})
     
+    # A field written through another handle after the cache was filled
+    from lab.job import Job
+    Job.get(lab._job.id).update_job_data_field("external", "kept")
+
     # Update with new config
     lab.set_config({"epochs": 20})
     
     job_data = lab._job.get_job_data()
     assert job_data["epochs"] == 20  # Updated
     assert job_data["batch_size"] == 32  # Preserved
+    assert job_data["external"] == "kept"  # Not overwritten by the cached copy
+
+
+def test_lab_set_config_same_config_skips_write(tmp_path, monkeypatch):
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    from lab.lab_facade import Lab
+
+    lab = Lab()
+    lab.init(experiment_id="test_exp")
+    lab.set_config({"epochs": 10})
+
+    writes = []
+    monkeypatch.setattr(lab._job, "update_job_data_fields", lambda data: writes.append(data))
+    lab.set_config({"epochs": 10})
+    assert writes == []
+
+    lab.set_config({"epochs": 11})
+    assert writes[-1]["epochs"] == 11
 
 
 def test_lab_log(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -154,7 +188,6 @@ def test_lab_log(tmp_path, monkeypatch):
 
 
 def test_lab_update_progress(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -175,7 +208,6 @@ def test_lab_update_progress(tmp_path, monkeypatch):
 
 
 def test_lab_finish(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -196,10 +228,46 @@ def test_lab_finish(tmp_path, monkeypatch):
     assert job_data["completion_status"] == "success"
     assert job_data["completion_details"] == "Job completed"
     assert job_data["score"] == {"accuracy": 0.95}
+    assert lab.get_score() == {"accuracy": 0.95}
+
+
+def test_lab_finish_large_score_written_to_file(tmp_path, monkeypatch):
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    from lab.lab_facade import Lab
+
+    lab = Lab()
+    lab.init(experiment_id="test_exp")
+
+    score = {"per_sample": list(range(10000)), "accuracy": 0.9}
+    # Stored inline unless offloading is asked for
+    lab.finish(message="Job completed", score=score)
+    assert lab._job.get_job_data()["score"] == score
+    assert lab.get_score() == score
+
+    lab.finish(message="Job completed", score=score, offload_score=True)
+    ref = lab._job.get_job_data()["score"]
+    assert ref["keys"] == ["per_sample", "accuracy"]
+    with open(ref["$ref"]) as f:
+        assert json.load(f) == score
+    assert lab.get_score() == score
+
+    # The score file lives beside index.json, so an artifact named score.json
+    # does not overwrite it
+    assert os.path.dirname(ref["$ref"]) == lab._job.get_dir()
+    assert lab.get_artifact_paths() == []
+    src = tmp_path / "score.json"
+    src.write_text("{}")
+    lab.save_artifact(str(src))
+    assert lab.get_score() == score
 
 
 def test_lab_finish_with_paths(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -224,7 +292,6 @@ def test_lab_finish_with_paths(tmp_path, monkeypatch):
 
 
 def test_lab_error(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -247,7 +314,6 @@ def test_lab_error(tmp_path, monkeypatch):
 
 
 def test_lab_save_artifact_file(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -272,13 +338,12 @@ def test_lab_save_artifact_file(tmp_path, monkeypatch):
         assert f.read() == "test content"
     
     # Verify artifact is tracked in job_data
-    job_data = lab._job.get_job_data()
+    job_data = lab.job.get_job_data()
     assert "artifacts" in job_data
     assert dest_path in job_data["artifacts"]
 
 
 def test_lab_save_artifact_directory(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -306,7 +371,6 @@ def test_lab_save_artifact_directory(tmp_path, monkeypatch):
 
 
 def test_lab_save_artifact_with_name(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -328,8 +392,59 @@ def test_lab_save_artifact_with_name(tmp_path, monkeypatch):
     assert os.path.exists(dest_path)
 
 
+def test_lab_save_artifacts_batch(tmp_path, monkeypatch):
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    from lab.lab_facade import Lab
+
+    lab = Lab()
+    lab.init(experiment_id="test_exp")
+
+    test_file = tmp_path / "metrics.txt"
+    test_file.write_text("metrics")
+    test_dir = tmp_path / "plots"
+    test_dir.mkdir()
+    (test_dir / "loss.png").write_text("png")
+
+    dests = lab.save_artifacts_batch([(str(test_file), None), (str(test_dir), "epoch_plots")])
+
+    assert [os.path.basename(d) for d in dests] == ["metrics.txt", "epoch_plots"]
+    with open(dests[0], "r") as f:
+        assert f.read() == "metrics"
+    assert os.path.isfile(os.path.join(dests[1], "loss.png"))
+    assert lab.job.get_job_data()["artifacts"] == dests
+
+    # A missing source fails before anything is copied
+    try:
+        lab.save_artifacts_batch([(str(test_file), "again.txt"), ("/nonexistent/path", None)])
+        assert False, "Should have raised FileNotFoundError"
+    except FileNotFoundError:
+        pass
+    assert not os.path.exists(os.path.join(os.path.dirname(dests[0]), "again.txt"))
+
+    # Two sources landing on the same name are rejected before copying
+    other = tmp_path / "other" / "metrics.txt"
+    other.parent.mkdir()
+    other.write_text("other")
+    for batch in (
+        [(str(test_file), None), (str(other), None)],
+        [(str(test_file), "same.txt"), (str(test_dir), "same.txt")],
+    ):
+        try:
+            lab.save_artifacts_batch(batch)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+    assert not os.path.exists(os.path.join(os.path.dirname(dests[0]), "same.txt"))
+    assert lab.job.get_job_data()["artifacts"] == dests
+
+
 def test_lab_save_artifact_invalid_path(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -356,7 +471,6 @@ def test_lab_save_artifact_invalid_path(tmp_path, monkeypatch):
 
 
 def test_lab_save_checkpoint(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -379,14 +493,92 @@ def test_lab_save_checkpoint(tmp_path, monkeypatch):
     assert os.path.isfile(dest_path)
     
     # Verify checkpoint is tracked in job_data
-    job_data = lab._job.get_job_data()
+    job_data = lab.job.get_job_data()
     assert "checkpoints" in job_data
     assert dest_path in job_data["checkpoints"]
     assert job_data["latest_checkpoint"] == dest_path
 
 
+def test_lab_save_checkpoint_file_keeps_metadata(tmp_path, monkeypatch):
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    from lab.lab_facade import Lab
+
+    lab = Lab()
+    lab.init(experiment_id="test_exp")
+
+    test_file = tmp_path / "model.safetensors"
+    test_file.write_bytes(b"x" * 100_000)
+    os.utime(test_file, (1_600_000_000, 1_600_000_000))
+
+    dest_path = lab.save_checkpoint(str(test_file))
+
+    with open(dest_path, "rb") as f:
+        assert f.read() == b"x" * 100_000
+    assert os.stat(dest_path).st_mtime == 1_600_000_000
+
+
+def test_lab_save_checkpoint_already_in_place(tmp_path, monkeypatch):
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    from lab.lab_facade import Lab
+
+    lab = Lab()
+    lab.init(experiment_id="test_exp")
+
+    # A trainer writing straight into the checkpoints dir, then registering it
+    ckpt_dir = os.path.join(lab.get_checkpoints_dir(), "step-100")
+    os.makedirs(ckpt_dir)
+    with open(os.path.join(ckpt_dir, "model.bin"), "w") as f:
+        f.write("weights")
+    ckpt_file = os.path.join(lab.get_checkpoints_dir(), "optimizer.pt")
+    with open(ckpt_file, "w") as f:
+        f.write("state")
+
+    assert lab.save_checkpoint(ckpt_dir) == ckpt_dir
+    assert lab.save_checkpoint(ckpt_file) == ckpt_file
+
+    with open(os.path.join(ckpt_dir, "model.bin")) as f:
+        assert f.read() == "weights"
+    with open(ckpt_file) as f:
+        assert f.read() == "state"
+
+
+def test_lab_save_checkpoint_pathlike(tmp_path, monkeypatch):
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    from lab.lab_facade import Lab
+
+    lab = Lab()
+    lab.init(experiment_id="test_exp")
+
+    ckpt_dir = tmp_path / "ckpt-10"
+    ckpt_dir.mkdir()
+    (ckpt_dir / "model.bin").write_text("weights")
+
+    # An absolute path with a trailing separator still uses the directory name
+    dest_path = lab.save_checkpoint(str(ckpt_dir) + os.sep)
+    assert os.path.basename(dest_path) == "ckpt-10"
+    dest_path = lab.save_checkpoint(ckpt_dir, name="copy")
+    assert os.path.isfile(os.path.join(dest_path, "model.bin"))
+
+
 def test_lab_save_checkpoint_directory(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -411,8 +603,139 @@ def test_lab_save_checkpoint_directory(tmp_path, monkeypatch):
     assert os.path.exists(os.path.join(dest_path, "model.bin"))
 
 
+def test_lab_save_checkpoint_directory_overwrite_modes(tmp_path, monkeypatch):
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    from lab.lab_facade import Lab
+
+    lab = Lab()
+    lab.init(experiment_id="test_exp")
+
+    first = tmp_path / "first"
+    first.mkdir()
+    (first / "old.bin").write_text("old")
+    second = tmp_path / "second"
+    second.mkdir()
+    (second / "new.bin").write_text("new")
+
+    dest_path = lab.save_checkpoint(str(first), name="ckpt")
+    lab.save_checkpoint(str(second), name="ckpt", overwrite="merge")
+    assert sorted(os.listdir(dest_path)) == ["new.bin", "old.bin"]
+
+    lab.save_checkpoint(str(second), name="ckpt")
+    assert os.listdir(dest_path) == ["new.bin"]
+
+
+def test_lab_tracking_writes_keep_other_job_updates(tmp_path, monkeypatch):
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    from lab.lab_facade import Lab
+    from lab.job import Job
+
+    lab = Lab()
+    lab.init(experiment_id="test_exp")
+    lab.set_config({"lr": 0.1})
+
+    paths = []
+    for i in range(5):
+        test_file = tmp_path / f"artifact_{i}.txt"
+        test_file.write_text(str(i))
+        paths.append(lab.save_artifact(str(test_file)))
+        # Writes through another handle to the same job are not lost
+        Job.get(lab._job.id).update_job_data_field(f"user_{i}", i)
+    lab.finish()
+
+    job_data = lab._job.get_job_data()
+    assert job_data["artifacts"] == paths
+    assert all(job_data[f"user_{i}"] == i for i in range(5))
+    assert job_data["lr"] == 0.1
+    assert job_data["completion_status"] == "success"
+
+
+def test_lab_save_model_writes_provenance_by_finish(tmp_path, monkeypatch):
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    from lab.lab_facade import Lab
+
+    lab = Lab()
+    lab.init(experiment_id="test_exp")
+
+    model_dir = tmp_path / "my_model"
+    model_dir.mkdir()
+    (model_dir / "config.json").write_text(json.dumps({"architectures": ["LlamaForCausalLM"]}))
+    (model_dir / "model.safetensors").write_bytes(b"w" * 1000)
+
+    dest_path = lab.save_model(str(model_dir), name="tuned")
+    assert os.path.basename(dest_path) == f"{lab.job.id}_tuned"
+
+    lab.finish()
+
+    with open(os.path.join(dest_path, "_tlab_provenance.json")) as f:
+        provenance = json.load(f)
+    assert provenance["model_architecture"] == "LlamaForCausalLM"
+    hashed = {os.path.basename(o["file_path"]) for o in provenance["md5_checksums"]}
+    assert {"config.json", "model.safetensors"} <= hashed
+    assert lab._job.get_job_data()["models"] == [dest_path]
+
+
+def test_lab_save_model_provenance_uses_config_at_save_time(tmp_path, monkeypatch):
+    import threading
+
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    from lab.lab_facade import Lab
+    from lab.model import Model
+
+    # Hold the background provenance write until the config has changed
+    release = threading.Event()
+    real_checksums = Model.create_md5_checksums
+
+    def delayed_checksums(self, path):
+        release.wait(5)
+        return real_checksums(self, path)
+
+    monkeypatch.setattr(Model, "create_md5_checksums", delayed_checksums)
+
+    lab = Lab()
+    lab.init(experiment_id="test_exp")
+    lab.set_config({"_config": {"lr": 1}})
+
+    model_dir = tmp_path / "my_model"
+    model_dir.mkdir()
+    (model_dir / "config.json").write_text(json.dumps({"architectures": ["LlamaForCausalLM"]}))
+    dest_path = lab.save_model(str(model_dir), name="tuned")
+
+    # In-place changes to the cached config after saving don't reach the file
+    lab._get_cached_job_data()["_config"]["lr"] = 2
+    release.set()
+    lab.finish()
+
+    with open(os.path.join(dest_path, "_tlab_provenance.json")) as f:
+        provenance = json.load(f)
+    assert provenance["parameters"] == {"lr": 1}
+
+
 def test_lab_save_dataset(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -474,7 +797,6 @@ def test_lab_save_dataset(tmp_path, monkeypatch):
 
 
 def test_lab_save_dataset_with_metadata(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -517,7 +839,6 @@ def test_lab_save_dataset_with_metadata(tmp_path, monkeypatch):
 
 
 def test_lab_save_dataset_image_format(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -557,8 +878,69 @@ def test_lab_save_dataset_image_format(tmp_path, monkeypatch):
     assert os.path.basename(output_path) == "metadata.jsonl"
 
 
+def test_lab_save_dataset_parquet_format(tmp_path, monkeypatch):
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    from lab.lab_facade import Lab
+
+    lab = Lab()
+    lab.init(experiment_id="test_exp")
+
+    class MockDataFrame:
+        def __init__(self, data):
+            self.data = data
+            self.parquet_kwargs = None
+
+        def __len__(self):
+            return len(self.data)
+
+        def to_parquet(self, path, **kwargs):
+            self.parquet_kwargs = kwargs
+            path.write(b"PAR1" + json.dumps(self.data).encode() + b"PAR1")
+
+    df = MockDataFrame([{"a": 1}, {"a": 2}])
+
+    output_path = lab.save_dataset(df, "test_dataset_parquet", format="parquet")
+
+    assert os.path.basename(output_path) == "test_dataset_parquet.parquet"
+    with open(output_path, "rb") as f:
+        assert f.read().startswith(b"PAR1")
+    assert df.parquet_kwargs["compression"] == "zstd"
+
+    from lab.dataset import Dataset
+    metadata = Dataset.get("test_dataset_parquet").get_metadata()
+    assert metadata["json_data"]["files"] == ["test_dataset_parquet.parquet"]
+
+    try:
+        lab.save_dataset(df, "test_dataset_csv", format="csv")
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+
+    class MockHFDataset:
+        features = {"a": "int64"}
+
+        def __len__(self):
+            return 2
+
+        def to_pandas(self):
+            raise AssertionError("parquet output should not go through pandas")
+
+        def to_parquet(self, path_or_buf, **kwargs):
+            assert kwargs == {"compression": "zstd"}
+            path_or_buf.write(b"PAR1")
+
+    output_path = lab.save_dataset(MockHFDataset(), "test_dataset_hf", format="parquet")
+    with open(output_path, "rb") as f:
+        assert f.read() == b"PAR1"
+
+
 def test_lab_save_dataset_duplicate_error(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -596,7 +978,6 @@ def test_lab_save_dataset_duplicate_error(tmp_path, monkeypatch):
 
 
 def test_lab_properties(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -621,7 +1002,6 @@ def test_lab_properties(tmp_path, monkeypatch):
 
 
 def test_lab_properties_uninitialized(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -647,7 +1027,6 @@ def test_lab_properties_uninitialized(tmp_path, monkeypatch):
 
 
 def test_lab_get_checkpoints_dir(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -666,7 +1045,6 @@ def test_lab_get_checkpoints_dir(tmp_path, monkeypatch):
 
 
 def test_lab_get_artifacts_dir(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -685,7 +1063,6 @@ def test_lab_get_artifacts_dir(tmp_path, monkeypatch):
 
 
 def test_lab_get_checkpoint_paths(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -708,7 +1085,6 @@ def test_lab_get_checkpoint_paths(tmp_path, monkeypatch):
 
 
 def test_lab_get_artifact_paths(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -731,7 +1107,6 @@ def test_lab_get_artifact_paths(tmp_path, monkeypatch):
 
 
 def test_lab_capture_wandb_url(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -751,8 +1126,72 @@ def test_lab_capture_wandb_url(tmp_path, monkeypatch):
     assert job_data["wandb_run_url"] == wandb_url
 
 
+def test_lab_log_picks_up_late_wandb_url(tmp_path, monkeypatch):
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+    monkeypatch.delenv("WANDB_URL", raising=False)
+
+    from lab.lab_facade import Lab
+
+    lab = Lab()
+    lab.init(experiment_id="test_exp")
+    lab.log("no wandb yet")
+    assert "wandb_run_url" not in lab._job.get_job_data()
+
+    wandb_url = "https://wandb.ai/test/run-456"
+    monkeypatch.setenv("WANDB_URL", wandb_url)
+    lab.log("wandb started")
+    assert lab._job.get_job_data()["wandb_run_url"] == wandb_url
+
+
+def test_lab_picks_up_late_wandb_run(tmp_path, monkeypatch):
+    import sys
+    import types
+
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+    monkeypatch.delenv("WANDB_URL", raising=False)
+
+    from lab import lab_facade
+    from lab.lab_facade import Lab
+
+    monkeypatch.setattr(lab_facade, "_wandb", None)
+    monkeypatch.delitem(sys.modules, "wandb", raising=False)
+
+    # wandb imported and wandb.init() called after a few log() calls
+    lab = Lab()
+    lab.init(experiment_id="test_exp")
+    for i in range(3):
+        lab.log(f"step {i}")
+    assert "wandb_run_url" not in lab._job.get_job_data()
+
+    fake_wandb = types.SimpleNamespace(run=types.SimpleNamespace(url="https://wandb.ai/test/run-789"))
+    monkeypatch.setitem(sys.modules, "wandb", fake_wandb)
+    lab.log("wandb started")
+    assert lab._job.get_job_data()["wandb_run_url"] == "https://wandb.ai/test/run-789"
+
+    # wandb already imported, wandb.init() called late with few steps left:
+    # finish() probes once more
+    fake_wandb.run = None
+    lab = Lab()
+    lab.init(experiment_id="test_exp")
+    lab.log("step")
+    fake_wandb.run = types.SimpleNamespace(url="https://wandb.ai/test/run-790")
+    lab.log("step")
+    assert "wandb_run_url" not in lab._job.get_job_data()
+    lab.finish()
+    assert lab._job.get_job_data()["wandb_run_url"] == "https://wandb.ai/test/run-790"
+
+
 def test_lab_ensure_initialized(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -1,12 +1,7 @@
 import os
-import importlib
 
 
 def test_model_get_dir(tmp_path, monkeypatch):
-    for mod in ["lab.model", "lab.dirs"]:
-        if mod in importlib.sys.modules:
-            importlib.sys.modules.pop(mod)
-
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -20,3 +15,30 @@ def test_model_get_dir(tmp_path, monkeypatch):
     d = m.get_dir()
     assert d.endswith(os.path.join("models", "mixtral-8x7b"))
 
+
+
+def test_model_create_md5_checksums(tmp_path, monkeypatch):
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    import hashlib
+    from lab.model import Model
+
+    model_dir = tmp_path / "model"
+    (model_dir / "shards").mkdir(parents=True)
+    contents = {
+        "config.json": b"{}",
+        "shards/part-0.bin": b"a" * 3_000_000,
+        "shards/part-1.bin": b"b",
+    }
+    for rel, data in contents.items():
+        (model_dir / rel).write_bytes(data)
+
+    md5_objects = Model("m").create_md5_checksums(str(model_dir))
+
+    got = {os.path.relpath(o["file_path"], model_dir): o["md5_hash"] for o in md5_objects}
+    assert got == {rel: hashlib.md5(data).hexdigest() for rel, data in contents.items()}
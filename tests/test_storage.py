@@ -0,0 +1,171 @@
+import pytest
+
+pytestmark = pytest.mark.usefixtures("tfl_env")
+
+
+def _make_tree(root):
+    (root / "a" / "b").mkdir(parents=True)
+    (root / "top.txt").write_bytes(b"top")
+    (root / "a" / "mid.txt").write_bytes(b"mid")
+    (root / "a" / "b" / "leaf.txt").write_bytes(b"leaf")
+
+
+def _read_tree(root):
+    return {
+        str(p.relative_to(root)): p.read_bytes() for p in sorted(root.rglob("*")) if p.is_file()
+    }
+
+
+@pytest.mark.parametrize(
+    "src_fmt,dest_fmt",
+    [("{}", "file://{}"), ("file://{}", "{}"), ("file://{}", "file://{}")],
+)
+def test_copy_dir_file_uri_nested(tmp_path, src_fmt, dest_fmt):
+    from lab import storage
+
+    src = tmp_path / "src"
+    dest = tmp_path / "dest"
+    _make_tree(src)
+    dest.mkdir()
+
+    storage.copy_dir(src_fmt.format(src), dest_fmt.format(dest))
+    assert _read_tree(dest) == _read_tree(src)
+
+
+@pytest.mark.parametrize(
+    "src_fmt,dest_fmt",
+    [("{}", "{}"), ("{}", "file://{}"), ("file://{}", "{}"), ("file://{}", "file://{}")],
+)
+def test_copy_file_nested_overwrites_existing(tmp_path, src_fmt, dest_fmt):
+    from lab import storage
+
+    _make_tree(tmp_path / "src")
+    src = tmp_path / "src" / "a" / "b" / "leaf.txt"
+    dest = tmp_path / "dest" / "a" / "b" / "leaf.txt"
+    dest.parent.mkdir(parents=True)
+    dest.write_bytes(b"stale contents")
+
+    storage.copy_file(src_fmt.format(src), dest_fmt.format(dest))
+    assert dest.read_bytes() == b"leaf"
+
+
+def test_copy_dir_local_into_existing_dest(tmp_path):
+    from lab import storage
+
+    src = tmp_path / "src"
+    dest = tmp_path / "dest"
+    _make_tree(src)
+    (dest / "a").mkdir(parents=True)
+    (dest / "a" / "mid.txt").write_bytes(b"stale")
+    (dest / "keep.txt").write_bytes(b"keep")
+
+    storage.copy_dir(str(src), str(dest))
+    assert _read_tree(dest) == {**_read_tree(src), "keep.txt": b"keep"}
+
+
+@pytest.mark.parametrize("fmt", ["{}", "file://{}"])
+def test_rm_tree_missing_path_is_noop(tmp_path, fmt):
+    from lab import storage
+
+    storage.rm_tree(fmt.format(tmp_path / "missing" / "nested"))
+    storage.rm(fmt.format(tmp_path / "missing.txt"))
+
+
+@pytest.mark.parametrize("fmt", ["{}", "file://{}"])
+def test_cat_files_missing_key_is_none(tmp_path, fmt):
+    from lab import storage
+
+    _make_tree(tmp_path)
+    paths = [
+        fmt.format(tmp_path / "top.txt"),
+        fmt.format(tmp_path / "nope.txt"),
+        fmt.format(tmp_path / "a" / "b" / "leaf.txt"),
+    ]
+    assert storage.cat_files(paths) == [b"top", None, b"leaf"]
+    assert storage.cat_files([]) == []
+
+
+def test_stat_cache_invalidated_by_rm_and_rm_tree(tmp_path):
+    from lab import storage
+
+    _make_tree(tmp_path)
+    top = f"file://{tmp_path / 'top.txt'}"
+    nested = f"file://{tmp_path / 'a'}"
+    assert storage.exists(top)
+    assert storage.isdir(nested)
+
+    storage.rm(top)
+    assert not storage.exists(top)
+    storage.rm_tree(nested)
+    assert not storage.isdir(nested)
+
+    # Negative answers are not cached, so a recreated directory shows up at once
+    storage.makedirs(f"{nested}/b")
+    assert storage.isdir(nested)
+    assert storage.exists(f"{nested}/b")
+
+
+def test_makedirs_existing_dir_ok_but_existing_file_raises(tmp_path):
+    from lab import storage
+
+    storage.makedirs(str(tmp_path / "a" / "b"))
+    storage.makedirs(str(tmp_path / "a" / "b"))
+    assert (tmp_path / "a" / "b").is_dir()
+
+    (tmp_path / "f").write_bytes(b"x")
+    try:
+        storage.makedirs(str(tmp_path / "f"))
+        assert False, "expected FileExistsError"
+    except FileExistsError:
+        pass
+
+
+def test_stat_cache_keyed_by_storage_root_and_dropped_by_writes(tmp_path, monkeypatch):
+    from lab import storage
+
+    _make_tree(tmp_path)
+    top = tmp_path / "top.txt"
+    top_uri = f"file://{top}"
+
+    # Answers cached under one storage root are not reused under another
+    monkeypatch.setenv("TFL_HOME_DIR", str(tmp_path / "home_a"))
+    assert storage.exists(top_uri)
+    top.unlink()
+    assert storage.exists(top_uri)  # still cached for this root
+    monkeypatch.setenv("TFL_HOME_DIR", str(tmp_path / "home_b"))
+    assert not storage.exists(top_uri)
+
+    # makedirs and copies through storage drop cached answers
+    for write in (
+        lambda: storage.makedirs(f"file://{tmp_path / 'new_dir'}"),
+        lambda: storage.copy_file(str(tmp_path / "a" / "mid.txt"), f"file://{tmp_path / 'copy.txt'}"),
+        lambda: storage.copy_dir(str(tmp_path / "a"), f"file://{tmp_path / 'copy_dir'}"),
+    ):
+        top.write_bytes(b"top")
+        assert storage.exists(top_uri)
+        top.unlink()
+        write()
+        assert not storage.exists(top_uri)
+
+
+def test_copy_tunables_read_at_copy_time(tmp_path, monkeypatch):
+    from lab import storage
+
+    # Set after lab.storage was imported
+    monkeypatch.setenv("TFL_COPY_CHUNK_MB", "16")
+    monkeypatch.setenv("TFL_COPY_PARALLELISM", "3")
+    assert storage._stream_chunk_size() == 16 * 1024 * 1024
+    assert storage._copy_workers() == 3
+
+    seen = []
+    real_stream_copy = storage._stream_copy
+
+    def recording_stream_copy(r, w, chunk_size):
+        seen.append(chunk_size)
+        real_stream_copy(r, w, chunk_size)
+
+    monkeypatch.setattr(storage, "_stream_copy", recording_stream_copy)
+    _make_tree(tmp_path / "src")
+    storage.copy_file(f"file://{tmp_path / 'src' / 'top.txt'}", f"file://{tmp_path / 'top.txt'}")
+    assert seen == [16 * 1024 * 1024]
+    assert (tmp_path / "top.txt").read_bytes() == b"top"
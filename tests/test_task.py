@@ -1,15 +1,7 @@
 import os
-import importlib
-
-
-def _fresh(monkeypatch):
-    for mod in ["lab.task", "lab.dirs", "lab.experiment"]:
-        if mod in importlib.sys.modules:
-            importlib.sys.modules.pop(mod)
 
 
 def test_task_get_dir(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -25,7 +17,6 @@ def test_task_get_dir(tmp_path, monkeypatch):
 
 
 def test_task_create_and_get(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -50,7 +41,6 @@ def test_task_create_and_get(tmp_path, monkeypatch):
 
 
 def test_task_default_json(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -76,7 +66,6 @@ def test_task_default_json(tmp_path, monkeypatch):
 
 
 def test_task_set_metadata(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -120,7 +109,6 @@ def test_task_set_metadata(tmp_path, monkeypatch):
 
 
 def test_task_get_metadata(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -139,7 +127,6 @@ def test_task_get_metadata(tmp_path, monkeypatch):
 
 
 def test_task_list_all(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -172,7 +159,6 @@ def test_task_list_all(tmp_path, monkeypatch):
 
 
 def test_task_list_by_type(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -201,7 +187,6 @@ def test_task_list_by_type(tmp_path, monkeypatch):
 
 
 def test_task_list_by_experiment(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -230,7 +215,6 @@ def test_task_list_by_experiment(tmp_path, monkeypatch):
 
 
 def test_task_list_by_type_in_experiment(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -259,7 +243,6 @@ def test_task_list_by_type_in_experiment(tmp_path, monkeypatch):
 
 
 def test_task_get_by_id(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -285,7 +268,6 @@ def test_task_get_by_id(tmp_path, monkeypatch):
 
 
 def test_task_delete_all(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -312,8 +294,28 @@ def test_task_delete_all(tmp_path, monkeypatch):
         assert len(os.listdir(tasks_dir)) == 0
 
 
+def test_task_delete_all_keeps_non_task_files(tmp_path, monkeypatch):
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    from lab.task import Task
+    from lab.dirs import get_tasks_dir
+
+    Task.create("task_to_delete")
+    tasks_dir = get_tasks_dir()
+    with open(os.path.join(tasks_dir, "README.txt"), "w") as f:
+        f.write("not a task")
+
+    Task.delete_all()
+
+    assert os.listdir(tasks_dir) == ["README.txt"]
+
+
 def test_task_list_all_empty_dir(tmp_path, monkeypatch):
-    _fresh(monkeypatch)
     home = tmp_path / ".tfl_home"
     ws = tmp_path / ".tfl_ws"
     home.mkdir()
@@ -328,3 +330,54 @@ def test_task_list_all_empty_dir(tmp_path, monkeypatch):
     assert isinstance(all_tasks, list)
     # Should return empty list, not raise error
 
+
+
+def test_task_list_skips_non_task_entries(tmp_path, monkeypatch):
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    from lab.task import Task
+    from lab.dirs import get_tasks_dir
+
+    good = Task.create("good_task")
+    good.set_metadata(name="Good", type="training")
+    tasks_dir = get_tasks_dir()
+    # A stray file, a task dir without index.json and one with corrupt metadata
+    with open(os.path.join(tasks_dir, "notes.txt"), "w") as f:
+        f.write("not a task")
+    os.makedirs(os.path.join(tasks_dir, "no_index"))
+    os.makedirs(os.path.join(tasks_dir, "corrupt"))
+    with open(os.path.join(tasks_dir, "corrupt", "index.json"), "w") as f:
+        f.write("{not json")
+
+    all_tasks = Task.list_all()
+    # Unreadable metadata is listed as empty rather than failing the listing
+    assert [t for t in all_tasks if t.get("id")] == [good.get_metadata()]
+    assert all(t == {} for t in all_tasks if not t.get("id"))
+    assert "notes.txt" not in {t.get("id") for t in all_tasks}
+
+    assert [t["id"] for t in Task.list_by_type("training")] == ["good_task"]
+    assert Task.list_by_type("evaluation") == []
+
+
+def test_task_list_by_type_filters_exactly(tmp_path, monkeypatch):
+    home = tmp_path / ".tfl_home"
+    ws = tmp_path / ".tfl_ws"
+    home.mkdir()
+    ws.mkdir()
+    monkeypatch.setenv("TFL_HOME_DIR", str(home))
+    monkeypatch.setenv("TFL_WORKSPACE_DIR", str(ws))
+
+    from lab.task import Task
+
+    for task_id, task_type in [("t1", "training"), ("t2", "evaluation"), ("t3", "training"), ("t4", "")]:
+        Task.create(task_id).set_metadata(type=task_type)
+
+    assert {t["id"] for t in Task.list_by_type("training")} == {"t1", "t3"}
+    assert {t["id"] for t in Task.list_by_type("evaluation")} == {"t2"}
+    assert Task.list_by_type("export") == []
+    assert {t["id"] for t in Task.list_by_type_in_experiment("training", None)} == {"t1", "t3"}